@@ -0,0 +1,33 @@
+"""
+Optional native extension build for navign-maintenance.
+
+All metadata lives in pyproject.toml. This file only adds the Cython batch
+keygen extension (src/_keygen.pyx) when Cython is installed; the extension is
+marked optional, so a missing compiler or OpenSSL headers never break the
+install and crypto.py falls back to the pure-Python path.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    from setuptools import Extension
+
+    ext_modules = cythonize(
+        [
+            Extension(
+                "src._keygen",
+                ["src/_keygen.pyx"],
+                libraries=["crypto"],
+                # The EC_KEY API is deprecated but still shipped in OpenSSL 3
+                define_macros=[("OPENSSL_SUPPRESS_DEPRECATED", None)],
+                optional=True,
+            )
+        ],
+        compiler_directives={"language_level": "3"},
+    )
+
+setup(ext_modules=ext_modules)
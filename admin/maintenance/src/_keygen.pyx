@@ -0,0 +1,130 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled P-256 batch key generation loop.
+
+Runs the whole keygen + serialize loop in C against libcrypto, so there is no
+Python frame per key. Output layout matches ``crypto.generate_p256_key_pairs``.
+Built optionally by ``setup.py`` when Cython and the OpenSSL headers are present.
+"""
+
+from libc.stdint cimport uint8_t
+
+
+cdef extern from "openssl/ec.h":
+    ctypedef struct EC_GROUP:
+        pass
+    ctypedef struct EC_POINT:
+        pass
+    ctypedef struct EC_KEY:
+        pass
+    ctypedef struct BIGNUM:
+        pass
+    ctypedef struct BN_CTX:
+        pass
+
+    ctypedef enum point_conversion_form_t:
+        POINT_CONVERSION_UNCOMPRESSED
+
+    EC_GROUP *EC_GROUP_new_by_curve_name(int nid) nogil
+    void EC_GROUP_free(EC_GROUP *group) nogil
+    EC_KEY *EC_KEY_new() nogil
+    int EC_KEY_set_group(EC_KEY *key, const EC_GROUP *group) nogil
+    int EC_KEY_generate_key(EC_KEY *key) nogil
+    const BIGNUM *EC_KEY_get0_private_key(const EC_KEY *key) nogil
+    const EC_POINT *EC_KEY_get0_public_key(const EC_KEY *key) nogil
+    void EC_KEY_free(EC_KEY *key) nogil
+    size_t EC_POINT_point2oct(
+        const EC_GROUP *group,
+        const EC_POINT *p,
+        point_conversion_form_t form,
+        unsigned char *buf,
+        size_t len,
+        BN_CTX *ctx,
+    ) nogil
+
+
+cdef extern from "openssl/bn.h":
+    int BN_bn2binpad(const BIGNUM *a, unsigned char *to, int tolen) nogil
+    BN_CTX *BN_CTX_new() nogil
+    void BN_CTX_free(BN_CTX *ctx) nogil
+
+
+cdef extern from "openssl/obj_mac.h":
+    int NID_X9_62_prime256v1
+
+
+cdef enum:
+    PRIVATE_KEY_SIZE = 32
+    PUBLIC_KEY_SIZE = 65
+
+
+def generate_batch(size_t n):
+    """
+    Generate n P-256 key pairs.
+
+    Args:
+        n: Number of key pairs to generate
+
+    Returns:
+        Tuple of (private_keys, public_keys) packed back to back, n * 32 and
+        n * 65 bytes respectively
+
+    Raises:
+        RuntimeError: If libcrypto fails to create the curve or a key
+    """
+    cdef bytearray private_buf = bytearray(n * PRIVATE_KEY_SIZE)
+    cdef bytearray public_buf = bytearray(n * PUBLIC_KEY_SIZE)
+    cdef uint8_t *private_out = private_buf
+    cdef uint8_t *public_out = public_buf
+    cdef EC_GROUP *group
+    cdef EC_KEY *key
+    cdef BN_CTX *bn_ctx
+    cdef size_t i
+    cdef bint ok = True
+
+    group = EC_GROUP_new_by_curve_name(NID_X9_62_prime256v1)
+    if group == NULL:
+        raise RuntimeError("EC_GROUP_new_by_curve_name failed")
+
+    # One scratch context for the whole batch instead of one per key
+    bn_ctx = BN_CTX_new()
+    if bn_ctx == NULL:
+        EC_GROUP_free(group)
+        raise RuntimeError("BN_CTX_new failed")
+
+    with nogil:
+        for i in range(n):
+            key = EC_KEY_new()
+            if key == NULL:
+                ok = False
+                break
+
+            ok = (
+                EC_KEY_set_group(key, group) == 1
+                and EC_KEY_generate_key(key) == 1
+                and BN_bn2binpad(
+                    EC_KEY_get0_private_key(key),
+                    &private_out[i * PRIVATE_KEY_SIZE],
+                    PRIVATE_KEY_SIZE,
+                ) == PRIVATE_KEY_SIZE
+                and EC_POINT_point2oct(
+                    group,
+                    EC_KEY_get0_public_key(key),
+                    POINT_CONVERSION_UNCOMPRESSED,
+                    &public_out[i * PUBLIC_KEY_SIZE],
+                    PUBLIC_KEY_SIZE,
+                    bn_ctx,
+                ) == PUBLIC_KEY_SIZE
+            )
+            EC_KEY_free(key)
+
+            if not ok:
+                break
+
+    BN_CTX_free(bn_ctx)
+    EC_GROUP_free(group)
+
+    if not ok:
+        raise RuntimeError("libcrypto failed to generate a P-256 key pair")
+
+    return bytes(private_buf), bytes(public_buf)
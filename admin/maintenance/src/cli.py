@@ -8,9 +8,10 @@ This tool provides commands for:
 - Flashing firmware to beacons
 """
 
+import asyncio
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import click
 
@@ -63,6 +64,20 @@ def main():
 @click.option("--firmware-version", default="0.1.0", help="Firmware version")
 @click.option("--hardware-revision", default="v1.0", help="Hardware revision")
 @click.option("--area-id", help="Area ID where beacon is located")
+@click.option(
+    "--count",
+    "-n",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of keys to generate (bulk provisioning, requires --dry-run)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Worker processes for bulk key generation (default: one per CPU)",
+)
 def fuse_priv_key(
     output_dir: Path,
     key_name: str,
@@ -77,11 +92,25 @@ def fuse_priv_key(
     firmware_version: str,
     hardware_revision: str,
     area_id: Optional[str],
+    count: int,
+    workers: Optional[int],
 ):
     """Generate, store, and fuse private key to BLOCK_KEY0."""
     click.echo("🔑 ESP32-C3 eFuse Private Key Management")
     click.echo("=" * 42)
 
+    # A chip has a single BLOCK_KEY0, so bulk generation only stores keys
+    if count > 1:
+        if not dry_run or register:
+            click.secho(
+                "❌ --count > 1 requires --dry-run and cannot be combined with --register",
+                fg="red",
+                err=True,
+            )
+            sys.exit(1)
+        _generate_key_batch(output_dir, key_name, count, force, workers)
+        return
+
     # Step 1: Check if espefuse.py exists
     if not dry_run:
         click.echo("🔍 Checking for espefuse.py command...")
@@ -134,6 +163,7 @@ def fuse_priv_key(
         generated_at=crypto.get_timestamp_rfc3339(),
         fused=False,
         chip_info=None,
+        public_key_pem=crypto.public_key_to_pem_fast(public_key_bytes),
     )
     metadata.save(metadata_path)
 
@@ -198,9 +228,6 @@ def fuse_priv_key(
         if not device_id:
             device_id = crypto.generate_device_id()
 
-        # Convert public key to PEM
-        public_key_pem = crypto.public_key_to_pem(public_key_bytes)
-
         # Register with orchestrator
         try:
             client = grpc_client.BeaconRegistrationClient(orchestrator_addr)
@@ -210,7 +237,7 @@ def fuse_priv_key(
                 entity_id=entity_id,
                 device_id=device_id,
                 device_type=device_type,
-                public_key_pem=public_key_pem,
+                public_key_pem=metadata.public_key_pem,
                 firmware_version=firmware_version,
                 hardware_revision=hardware_revision,
                 capabilities=["UnlockGate"],
@@ -229,6 +256,69 @@ def fuse_priv_key(
             sys.exit(1)
 
 
+def _generate_key_batch(
+    output_dir: Path,
+    key_name: str,
+    count: int,
+    force: bool,
+    workers: Optional[int],
+) -> None:
+    """Generate and store a batch of keys named ``<key_name>_<index>``."""
+    width = len(str(count - 1))
+    names = [f"{key_name}_{i:0{width}d}" for i in range(count)]
+
+    # Check if any files already exist before generating anything
+    if not force:
+        for name in names:
+            if (output_dir / f"{name}_private.bin").exists() or (
+                output_dir / f"{name}_metadata.json"
+            ).exists():
+                click.secho(
+                    f"❌ Key files for {name} already exist. Use --force to overwrite.",
+                    fg="red",
+                    err=True,
+                )
+                sys.exit(1)
+
+    click.echo(f"\n📋 Step 1: Generating {count} ECDSA P-256 private keys...")
+    private_keys, public_keys = crypto.generate_p256_key_pairs_parallel(count, workers)
+    click.secho(f"✅ {count} private keys generated successfully", fg="green")
+
+    click.echo("\n💾 Step 2: Storing key files...")
+    generated_at = crypto.get_timestamp_rfc3339()
+    priv_size = crypto.PRIVATE_KEY_SIZE
+    pub_size = crypto.PUBLIC_KEY_SIZE
+
+    files = []
+    for i, name in enumerate(names):
+        private_key_path = output_dir / f"{name}_private.bin"
+        files.append(
+            (private_key_path, private_keys[i * priv_size : (i + 1) * priv_size])
+        )
+
+        public_key_bytes = public_keys[i * pub_size : (i + 1) * pub_size]
+        metadata = models.KeyMetadata(
+            key_name=name,
+            private_key_file=private_key_path.name,
+            public_key_hex=public_key_bytes.hex(),
+            generated_at=generated_at,
+            fused=False,
+            chip_info=None,
+            public_key_pem=crypto.public_key_to_pem_fast(public_key_bytes),
+        )
+        files.append(
+            (
+                output_dir / f"{name}_metadata.json",
+                metadata.to_json_compact().encode("utf-8"),
+            )
+        )
+
+    crypto.save_batch(files)
+
+    click.secho(f"✅ {count} key pairs stored in {output_dir}", fg="green")
+    click.echo("\n🏃 Dry run mode - skipping eFuse programming")
+
+
 @main.command("register-beacon")
 @click.option(
     "--metadata",
@@ -281,9 +371,7 @@ def register_beacon(
     if not device_id:
         device_id = crypto.generate_device_id()
 
-    # Convert public key hex to PEM
-    public_key_bytes = bytes.fromhex(key_metadata.public_key_hex)
-    public_key_pem = crypto.public_key_to_pem(public_key_bytes)
+    public_key_pem = _metadata_public_key_pem(key_metadata)
 
     # Register with orchestrator
     try:
@@ -312,6 +400,149 @@ def register_beacon(
         sys.exit(1)
 
 
+@main.command("register-beacons-batch")
+@click.option(
+    "--metadata-dir",
+    "-d",
+    required=True,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory containing *_metadata.json key metadata files",
+)
+@click.option(
+    "--orchestrator-addr",
+    default="localhost:50051",
+    help="Orchestrator gRPC address",
+)
+@click.option(
+    "--entity-id", "-e", required=True, help="Entity ID for beacon registration"
+)
+@click.option(
+    "--device-type",
+    default="Pathway",
+    type=click.Choice(["Merchant", "Pathway", "Connection", "Turnstile"]),
+    help="Device type",
+)
+@click.option("--firmware-version", default="0.1.0", help="Firmware version")
+@click.option("--hardware-revision", default="v1.0", help="Hardware revision")
+@click.option("--area-id", help="Area ID where beacons are located")
+@click.option(
+    "--concurrency",
+    default=16,
+    type=click.IntRange(min=1),
+    help="Maximum registrations in flight at once",
+)
+def register_beacons_batch(
+    metadata_dir: Path,
+    orchestrator_addr: str,
+    entity_id: str,
+    device_type: str,
+    firmware_version: str,
+    hardware_revision: str,
+    area_id: Optional[str],
+    concurrency: int,
+):
+    """Register every beacon in a metadata directory concurrently."""
+    click.echo(f"📡 Registering beacons from {metadata_dir} with orchestrator...")
+
+    metadata_paths = sorted(metadata_dir.glob("*_metadata.json"))
+    if not metadata_paths:
+        click.secho("❌ No *_metadata.json files found", fg="red", err=True)
+        sys.exit(1)
+
+    # Load all metadata up front so a bad file fails before any RPC is sent
+    try:
+        public_key_pems = [
+            _metadata_public_key_pem(models.KeyMetadata.from_file(path))
+            for path in metadata_paths
+        ]
+    except Exception as e:
+        click.secho(f"❌ Failed to read metadata: {e}", fg="red", err=True)
+        sys.exit(1)
+
+    click.echo(f"   Found {len(public_key_pems)} beacons")
+
+    device_ids = [crypto.generate_device_id() for _ in metadata_paths]
+
+    results = asyncio.run(
+        _register_beacons_async(
+            orchestrator_addr,
+            list(zip(device_ids, public_key_pems)),
+            concurrency,
+            entity_id=entity_id,
+            device_type=device_type,
+            firmware_version=firmware_version,
+            hardware_revision=hardware_revision,
+            capabilities=["UnlockGate"],
+            area_id=area_id,
+        )
+    )
+
+    failed = 0
+    for path, device_id, result in zip(metadata_paths, device_ids, results):
+        if isinstance(result, Exception):
+            failed += 1
+            click.secho(f"❌ {path.name}: {result}", fg="red", err=True)
+        else:
+            click.echo(f"   {path.name} → Device ID: {device_id}")
+
+    succeeded = len(results) - failed
+    click.secho(
+        f"✅ Registered {succeeded}/{len(results)} beacons",
+        fg="green" if not failed else "yellow",
+    )
+
+    if failed:
+        sys.exit(1)
+
+
+async def _register_beacons_async(
+    orchestrator_addr: str,
+    beacons: List[Tuple[str, str]],
+    concurrency: int,
+    **kwargs,
+) -> list:
+    """
+    Register (device_id, public_key_pem) pairs over one channel.
+
+    At most ``concurrency`` registrations are in flight at once. Exceptions
+    are collected in place of results, in the order of ``beacons``.
+    """
+    client = grpc_client.BeaconRegistrationClientAsync(orchestrator_addr)
+    await client.connect()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def register(device_id: str, public_key_pem: str) -> dict:
+        async with semaphore:
+            return await client.register_beacon(
+                device_id=device_id, public_key_pem=public_key_pem, **kwargs
+            )
+
+    try:
+        return await asyncio.gather(
+            *(
+                register(device_id, public_key_pem)
+                for device_id, public_key_pem in beacons
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await client.close()
+
+
+def _metadata_public_key_pem(key_metadata: models.KeyMetadata) -> str:
+    """
+    Use the cached PEM, falling back to deriving it from hex for old metadata.
+
+    Metadata files are written by this tool, so the fallback skips the
+    on-curve check and only verifies the key is a 65-byte uncompressed point.
+    """
+    if key_metadata.public_key_pem:
+        return key_metadata.public_key_pem
+
+    public_key_bytes = bytes.fromhex(key_metadata.public_key_hex)
+    return crypto.public_key_to_pem_fast(public_key_bytes)
+
+
 @main.command("flash-firmware")
 @click.option(
     "--firmware",
@@ -5,13 +5,39 @@ Provides P-256 ECDSA key pair generation, PEM conversion, and hex encoding
 compatible with the Navign beacon system.
 """
 
+import base64
+import functools
+import os
 import secrets
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import ec
+# cryptography is imported inside the functions that need it so that CLI
+# commands which never touch keys (--help, flash-firmware) skip loading it
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+# Size of a raw P-256 private scalar in bytes
+PRIVATE_KEY_SIZE = 32
+
+# Size of an uncompressed SEC1 P-256 public key in bytes (0x04 + x + y)
+PUBLIC_KEY_SIZE = 65
+
+# DER SubjectPublicKeyInfo header for an uncompressed P-256 point:
+# SEQUENCE { SEQUENCE { id-ecPublicKey, prime256v1 }, BIT STRING (65 bytes) }
+_P256_SPKI_PREFIX = bytes.fromhex(
+    "3059301306072a8648ce3d020106082a8648ce3d030107034200"
+)
+
+
+@functools.cache
+def _p256() -> "ec.SECP256R1":
+    """Return the shared P-256 curve instance (curve descriptors are immutable)."""
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    return ec.SECP256R1()
 
 
 def generate_p256_key_pair() -> Tuple[bytes, bytes, str]:
@@ -24,11 +50,16 @@ def generate_p256_key_pair() -> Tuple[bytes, bytes, str]:
         - public_key_bytes: 65-byte uncompressed public key (SEC1)
         - public_key_hex: Hex-encoded public key (130 characters)
     """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
     # Generate private key using P-256 (secp256r1) curve
-    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_key = ec.generate_private_key(_p256())
 
     # Extract raw private key bytes (32 bytes)
-    private_key_bytes = private_key.private_numbers().private_value.to_bytes(32, "big")
+    private_key_bytes = private_key.private_numbers().private_value.to_bytes(
+        PRIVATE_KEY_SIZE, "big"
+    )
 
     # Get public key
     public_key = private_key.public_key()
@@ -45,6 +76,148 @@ def generate_p256_key_pair() -> Tuple[bytes, bytes, str]:
     return private_key_bytes, public_key_bytes, public_key_hex
 
 
+def generate_p256_key_pairs(n: int) -> Tuple[bytes, bytes]:
+    """
+    Generate a batch of P-256 ECDSA private/public key pairs.
+
+    Keys are packed back to back into two contiguous buffers, so key ``i``
+    is ``private_keys[i * PRIVATE_KEY_SIZE:(i + 1) * PRIVATE_KEY_SIZE]`` and
+    likewise for the public keys with ``PUBLIC_KEY_SIZE``.
+
+    Args:
+        n: Number of key pairs to generate
+
+    Returns:
+        Tuple of (private_keys, public_keys)
+        - private_keys: n * 32 bytes of raw private keys
+        - public_keys: n * 65 bytes of uncompressed SEC1 public keys
+
+    Set ``NAVIGN_NATIVE_KEYGEN=1`` to generate keys through libcrypto
+    directly (see ``crypto_native``); ``cryptography`` is used otherwise or
+    when libcrypto cannot be loaded.
+
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError(f"Key count must be non-negative, got {n}")
+
+    if os.environ.get("NAVIGN_NATIVE_KEYGEN") == "1":
+        from . import crypto_native
+
+        if crypto_native.is_available():
+            return crypto_native.generate_p256_key_pairs(n)
+
+    private_buf = bytearray(n * PRIVATE_KEY_SIZE)
+    public_buf = bytearray(n * PUBLIC_KEY_SIZE)
+
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    # Bind hot attributes locally to keep the per-key loop tight
+    curve = _p256()
+    generate_private_key = ec.generate_private_key
+    encoding = serialization.Encoding.X962
+    public_format = serialization.PublicFormat.UncompressedPoint
+
+    for i in range(n):
+        private_key = generate_private_key(curve)
+
+        priv_offset = i * PRIVATE_KEY_SIZE
+        private_buf[priv_offset : priv_offset + PRIVATE_KEY_SIZE] = (
+            private_key.private_numbers().private_value.to_bytes(
+                PRIVATE_KEY_SIZE, "big"
+            )
+        )
+
+        pub_offset = i * PUBLIC_KEY_SIZE
+        public_buf[pub_offset : pub_offset + PUBLIC_KEY_SIZE] = (
+            private_key.public_key().public_bytes(
+                encoding=encoding, format=public_format
+            )
+        )
+
+    return bytes(private_buf), bytes(public_buf)
+
+
+def generate_p256_key_pairs_parallel(
+    n: int, workers: Optional[int] = None
+) -> Tuple[bytes, bytes]:
+    """
+    Generate a batch of P-256 key pairs across a pool of worker processes.
+
+    Key generation is CPU-bound inside OpenSSL, so threads do not help; the
+    batch is instead split into chunks that are generated independently by
+    ``generate_p256_key_pairs`` in each worker. OpenSSL reseeds its DRBG in
+    forked children, so workers never share random state.
+
+    Args:
+        n: Number of key pairs to generate
+        workers: Number of worker processes (defaults to ``os.cpu_count()``)
+
+    Returns:
+        Tuple of (private_keys, public_keys) in the same packed layout as
+        ``generate_p256_key_pairs``
+
+    Raises:
+        ValueError: If n is negative or workers is less than 1
+    """
+    if n < 0:
+        raise ValueError(f"Key count must be non-negative, got {n}")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Worker count must be at least 1, got {workers}")
+
+    # Not worth spinning up a pool for a single worker or a tiny batch
+    if workers == 1 or n < workers:
+        return generate_p256_key_pairs(n)
+
+    # Oversplit so a slow worker doesn't hold up the whole batch
+    chunk_size = max(1, n // (workers * 4))
+    chunks = [chunk_size] * (n // chunk_size)
+    if n % chunk_size:
+        chunks.append(n % chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(generate_p256_key_pairs, chunks))
+
+    return (
+        b"".join(private_keys for private_keys, _ in results),
+        b"".join(public_keys for _, public_keys in results),
+    )
+
+
+def generate_p256_key_pairs_cython(n: int) -> Tuple[bytes, bytes]:
+    """
+    Generate a batch of P-256 key pairs with the compiled ``_keygen`` loop.
+
+    The extension is built from ``_keygen.pyx`` by ``setup.py`` when Cython is
+    installed. If it is not available this falls back to
+    ``generate_p256_key_pairs``.
+
+    Args:
+        n: Number of key pairs to generate
+
+    Returns:
+        Tuple of (private_keys, public_keys) in the same packed layout as
+        ``generate_p256_key_pairs``
+
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError(f"Key count must be non-negative, got {n}")
+
+    try:
+        from . import _keygen
+    except ImportError:
+        return generate_p256_key_pairs(n)
+
+    return _keygen.generate_batch(n)
+
+
 def public_key_to_pem(public_key_bytes: bytes) -> str:
     """
     Convert public key bytes to PEM format for gRPC transmission.
@@ -55,10 +228,11 @@ def public_key_to_pem(public_key_bytes: bytes) -> str:
     Returns:
         PEM-encoded public key string
     """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
     # Load public key from bytes
-    public_key = ec.EllipticCurvePublicKey.from_encoded_point(
-        ec.SECP256R1(), public_key_bytes
-    )
+    public_key = ec.EllipticCurvePublicKey.from_encoded_point(_p256(), public_key_bytes)
 
     # Export as PEM
     pem = public_key.public_bytes(
@@ -69,15 +243,41 @@ def public_key_to_pem(public_key_bytes: bytes) -> str:
     return pem.decode("utf-8")
 
 
+def public_key_to_pem_fast(public_key_bytes: bytes) -> str:
+    """
+    Convert trusted public key bytes to PEM without decoding the point.
+
+    Prepends the fixed P-256 SubjectPublicKeyInfo header and base64-wraps the
+    result, producing the same output as ``public_key_to_pem``. The point is
+    not checked to be on the curve, so only use this for keys produced by
+    this module; use ``public_key_to_pem`` for untrusted input.
+
+    Args:
+        public_key_bytes: 65-byte uncompressed SEC1 public key
+
+    Returns:
+        PEM-encoded public key string
+
+    Raises:
+        ValueError: If the key is not a 65-byte uncompressed point
+    """
+    if len(public_key_bytes) != PUBLIC_KEY_SIZE or public_key_bytes[0] != 0x04:
+        raise ValueError("Expected a 65-byte uncompressed SEC1 public key")
+
+    b64 = base64.b64encode(_P256_SPKI_PREFIX + public_key_bytes).decode("ascii")
+    lines = "\n".join(b64[i : i + 64] for i in range(0, len(b64), 64))
+
+    return f"-----BEGIN PUBLIC KEY-----\n{lines}\n-----END PUBLIC KEY-----\n"
+
+
 def generate_device_id() -> str:
     """
     Generate a random 24-character hexadecimal device ID (12 bytes).
 
     Returns:
-        24-character hex string (e.g., "a1b2c3d4e5f6g7h8i9j0k1l2")
+        24-character hex string (e.g., "a1b2c3d4e5f6a7b8c9d0e1f2")
     """
-    random_bytes = secrets.token_bytes(12)
-    return random_bytes.hex()
+    return secrets.token_hex(12)
 
 
 def save_private_key(key_bytes: bytes, output_path: Path) -> None:
@@ -91,8 +291,36 @@ def save_private_key(key_bytes: bytes, output_path: Path) -> None:
     Raises:
         IOError: If file cannot be written
     """
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_bytes(key_bytes)
+    save_batch([(output_path, key_bytes)])
+
+
+def save_batch(files: List[Tuple[Path, bytes]], mode: int = 0o600) -> None:
+    """
+    Write several files with one mkdir per directory and raw fd writes.
+
+    Newly created files get the given permissions (owner read/write only by
+    default), which keeps private key material out of reach of other users.
+
+    Args:
+        files: List of (path, payload) tuples
+        mode: Permission bits for newly created files
+
+    Raises:
+        OSError: If a directory or file cannot be written
+    """
+    for parent in {path.parent for path, _ in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+    for path, payload in files:
+        fd = os.open(path, flags, mode)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
 
 
 def get_timestamp_rfc3339() -> str:
@@ -102,4 +330,4 @@ def get_timestamp_rfc3339() -> str:
     Returns:
         Timestamp string (e.g., "2025-01-15T10:30:00Z")
     """
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
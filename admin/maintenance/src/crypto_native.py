@@ -0,0 +1,165 @@
+"""
+Native P-256 key generation through libcrypto.
+
+Calls OpenSSL's low-level ``EC_KEY`` API directly with ctypes, skipping the
+EVP and object marshalling layers that ``cryptography`` goes through on every
+key. Output layout matches ``crypto.generate_p256_key_pairs``.
+
+This backend is opt-in: set ``NAVIGN_NATIVE_KEYGEN=1`` to route batch key
+generation through it. If libcrypto cannot be loaded, ``is_available()``
+returns False and callers fall back to ``cryptography``.
+"""
+
+import ctypes
+import ctypes.util
+from typing import Optional, Tuple
+
+# OpenSSL NID for the P-256 curve (a.k.a. prime256v1 / secp256r1)
+NID_X9_62_PRIME256V1 = 415
+
+# point_conversion_form_t value for 0x04 || x || y encoding
+POINT_CONVERSION_UNCOMPRESSED = 4
+
+PRIVATE_KEY_SIZE = 32
+PUBLIC_KEY_SIZE = 65
+
+
+def _load_libcrypto() -> Optional[ctypes.CDLL]:
+    """Load libcrypto and declare the signatures used by this module."""
+    path = ctypes.util.find_library("crypto")
+    if path is None:
+        return None
+
+    try:
+        lib = ctypes.CDLL(path)
+
+        lib.EC_GROUP_new_by_curve_name.argtypes = [ctypes.c_int]
+        lib.EC_GROUP_new_by_curve_name.restype = ctypes.c_void_p
+
+        lib.EC_KEY_new.argtypes = []
+        lib.EC_KEY_new.restype = ctypes.c_void_p
+
+        lib.EC_KEY_set_group.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        lib.EC_KEY_set_group.restype = ctypes.c_int
+
+        lib.EC_KEY_generate_key.argtypes = [ctypes.c_void_p]
+        lib.EC_KEY_generate_key.restype = ctypes.c_int
+
+        lib.EC_KEY_get0_private_key.argtypes = [ctypes.c_void_p]
+        lib.EC_KEY_get0_private_key.restype = ctypes.c_void_p
+
+        lib.EC_KEY_get0_public_key.argtypes = [ctypes.c_void_p]
+        lib.EC_KEY_get0_public_key.restype = ctypes.c_void_p
+
+        lib.EC_KEY_free.argtypes = [ctypes.c_void_p]
+        lib.EC_KEY_free.restype = None
+
+        lib.BN_bn2binpad.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+        lib.BN_bn2binpad.restype = ctypes.c_int
+
+        lib.BN_CTX_new.argtypes = []
+        lib.BN_CTX_new.restype = ctypes.c_void_p
+
+        lib.BN_CTX_free.argtypes = [ctypes.c_void_p]
+        lib.BN_CTX_free.restype = None
+
+        lib.EC_POINT_point2oct.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+            ctypes.c_void_p,
+        ]
+        lib.EC_POINT_point2oct.restype = ctypes.c_size_t
+    except (OSError, AttributeError):
+        return None
+
+    return lib
+
+
+_lib = _load_libcrypto()
+
+# The group is immutable and shared by every key generated in this process
+_group = _lib.EC_GROUP_new_by_curve_name(NID_X9_62_PRIME256V1) if _lib else None
+
+def is_available() -> bool:
+    """
+    Check if the native libcrypto backend can be used.
+
+    Returns:
+        True if libcrypto was loaded and the P-256 group was created
+    """
+    return bool(_group)
+
+
+def generate_p256_key_pairs(n: int) -> Tuple[bytes, bytes]:
+    """
+    Generate a batch of P-256 key pairs with libcrypto's EC_KEY API.
+
+    Args:
+        n: Number of key pairs to generate
+
+    Returns:
+        Tuple of (private_keys, public_keys) packed back to back, n * 32 and
+        n * 65 bytes respectively
+
+    Raises:
+        RuntimeError: If libcrypto is unavailable or key generation fails
+        ValueError: If n is negative
+    """
+    if not is_available():
+        raise RuntimeError("libcrypto is not available for native key generation")
+
+    if n < 0:
+        raise ValueError(f"Key count must be non-negative, got {n}")
+
+    private_buf = (ctypes.c_ubyte * (n * PRIVATE_KEY_SIZE))()
+    public_buf = (ctypes.c_ubyte * (n * PUBLIC_KEY_SIZE))()
+    private_base = ctypes.addressof(private_buf)
+    public_base = ctypes.addressof(public_buf)
+
+    lib = _lib
+    group = _group
+
+    # One scratch context for the whole batch instead of one per key
+    bn_ctx = lib.BN_CTX_new()
+    if not bn_ctx:
+        raise RuntimeError("BN_CTX_new failed")
+
+    try:
+        for i in range(n):
+            key = lib.EC_KEY_new()
+            if not key:
+                raise RuntimeError("EC_KEY_new failed")
+
+            try:
+                if not lib.EC_KEY_set_group(key, group):
+                    raise RuntimeError("EC_KEY_set_group failed")
+                if not lib.EC_KEY_generate_key(key):
+                    raise RuntimeError("EC_KEY_generate_key failed")
+
+                written = lib.BN_bn2binpad(
+                    lib.EC_KEY_get0_private_key(key),
+                    private_base + i * PRIVATE_KEY_SIZE,
+                    PRIVATE_KEY_SIZE,
+                )
+                if written != PRIVATE_KEY_SIZE:
+                    raise RuntimeError("BN_bn2binpad failed")
+
+                written = lib.EC_POINT_point2oct(
+                    group,
+                    lib.EC_KEY_get0_public_key(key),
+                    POINT_CONVERSION_UNCOMPRESSED,
+                    public_base + i * PUBLIC_KEY_SIZE,
+                    PUBLIC_KEY_SIZE,
+                    bn_ctx,
+                )
+                if written != PUBLIC_KEY_SIZE:
+                    raise RuntimeError("EC_POINT_point2oct failed")
+            finally:
+                lib.EC_KEY_free(key)
+    finally:
+        lib.BN_CTX_free(bn_ctx)
+
+    return bytes(private_buf), bytes(public_buf)
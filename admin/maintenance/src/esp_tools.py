@@ -4,6 +4,8 @@ ESP32-C3 hardware interaction tools.
 Wrappers for espefuse.py (eFuse programming) and firmware flashing tools.
 """
 
+import functools
+import importlib.util
 import shutil
 import subprocess
 from pathlib import Path
@@ -16,10 +18,14 @@ class ESPToolNotFoundError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def check_espefuse_available() -> bool:
     """
     Check if espefuse.py is available on the system.
 
+    The probe runs once per process; call
+    ``check_espefuse_available.cache_clear()`` to re-run it.
+
     Returns:
         True if espefuse.py is found, False otherwise
     """
@@ -27,6 +33,10 @@ def check_espefuse_available() -> bool:
     if shutil.which("espefuse.py"):
         return True
 
+    # Installed into this interpreter (pip install esptool): no subprocess needed
+    if importlib.util.find_spec("espefuse") is not None:
+        return True
+
     # Try python -m espefuse
     for python_cmd in ["python3", "python"]:
         if shutil.which(python_cmd):
@@ -113,19 +123,32 @@ def fuse_key_to_efuse(
 
     print(f"   Executing: {' '.join(cmd)}")
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-    # Print output
+    # Stream output as it is produced so long burns give live feedback
     print("   eFuse programming output:")
-    for line in result.stdout.splitlines():
-        if line.strip():
-            print(f"   {line}")
-
-
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line.strip():
+                print(f"   {line}", flush=True)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+@functools.lru_cache(maxsize=1)
 def detect_flash_tool() -> str:
     """
     Detect available firmware flashing tool.
 
+    A successful detection is cached for the rest of the process; call
+    ``detect_flash_tool.cache_clear()`` to re-run it.
+
     Returns:
         Name of detected tool ("espflash" or "esptool.py")
 
@@ -140,6 +163,10 @@ def detect_flash_tool() -> str:
     if shutil.which("esptool.py"):
         return "esptool.py"
 
+    # Installed into this interpreter: no subprocess needed
+    if importlib.util.find_spec("esptool") is not None:
+        return "esptool.py"
+
     # Try python -m esptool
     for python_cmd in ["python3", "python"]:
         if shutil.which(python_cmd):
@@ -9,6 +9,7 @@ import time
 from typing import List, Optional
 
 import grpc
+from google.protobuf.timestamp_pb2 import Timestamp
 
 # Import generated protobuf code (will be generated by generate_proto.sh)
 try:
@@ -35,6 +36,14 @@ except ImportError as e:
         ) from e
 
 
+# Keep the batch connection alive between bursts of concurrent registrations
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+]
+
+
 class BeaconRegistrationClient:
     """Client for registering beacons with the orchestrator."""
 
@@ -94,25 +103,15 @@ class BeaconRegistrationClient:
         if not self.stub:
             raise RuntimeError("Client not connected. Call connect() first.")
 
-        # Prepare location if area_id provided
-        location = None
-        if area_id:
-            location = sync_pb2.BeaconLocation(
-                area_id=area_id,
-                coordinates=sync_pb2.Location(x=0.0, y=0.0, z=0.0, floor=""),
-            )
-
-        # Create registration request
-        request = sync_pb2.BeaconRegistrationRequest(
+        request = _build_registration_request(
             entity_id=entity_id,
             device_id=device_id,
             device_type=device_type,
-            capabilities=capabilities,
-            public_key=public_key_pem,
+            public_key_pem=public_key_pem,
             firmware_version=firmware_version,
             hardware_revision=hardware_revision,
-            location=location,
-            registered_at=sync_pb2.Timestamp(seconds=int(time.time())),
+            capabilities=capabilities,
+            area_id=area_id,
         )
 
         print("   Sending beacon registration request...")
@@ -120,24 +119,136 @@ class BeaconRegistrationClient:
         # Send request
         response = self.stub.RegisterBeacon(request)
 
-        # Check if approved
-        if not response.approved:
-            raise RuntimeError("Beacon registration was not approved by orchestrator")
-
-        print("   ✅ Beacon approved by orchestrator")
-        print(f"      Beacon ID: {response.beacon_id}")
-        print(f"      Entity ID: {response.entity_id}")
-        print(f"      Sync interval: {response.sync_interval_seconds} seconds")
-
-        if response.firmware_update_available:
-            print("      ⚠️  Firmware update available")
-            if response.latest_firmware:
-                print(f"         Latest version: {response.latest_firmware.version}")
-
-        return {
-            "beacon_id": response.beacon_id,
-            "entity_id": response.entity_id,
-            "approved": response.approved,
-            "sync_interval_seconds": response.sync_interval_seconds,
-            "firmware_update_available": response.firmware_update_available,
-        }
+        return _handle_registration_response(response)
+
+
+class BeaconRegistrationClientAsync:
+    """
+    Asynchronous client for registering many beacons over one channel.
+
+    Registrations issued concurrently (e.g. with ``asyncio.gather``) are
+    multiplexed over a single HTTP/2 connection, so network round trips
+    overlap instead of being paid one beacon at a time.
+    """
+
+    def __init__(self, orchestrator_addr: str):
+        """
+        Initialize the async beacon registration client.
+
+        Args:
+            orchestrator_addr: Address of orchestrator (e.g., "localhost:50051")
+        """
+        self.orchestrator_addr = orchestrator_addr
+        self.channel: Optional[grpc.aio.Channel] = None
+        self.stub: Optional[sync_pb2_grpc.OrchestratorSyncStub] = None
+
+    async def connect(self) -> None:
+        """Open the channel to the orchestrator gRPC server."""
+        print(f"   Connecting to orchestrator at {self.orchestrator_addr}...")
+        self.channel = grpc.aio.insecure_channel(
+            self.orchestrator_addr, options=_CHANNEL_OPTIONS
+        )
+        self.stub = sync_pb2_grpc.OrchestratorSyncStub(self.channel)
+        print("   Connected successfully!")
+
+    async def close(self) -> None:
+        """Close the connection to the orchestrator."""
+        if self.channel:
+            await self.channel.close()
+
+    async def register_beacon(
+        self,
+        entity_id: str,
+        device_id: str,
+        device_type: str,
+        public_key_pem: str,
+        firmware_version: str,
+        hardware_revision: str,
+        capabilities: List[str],
+        area_id: Optional[str] = None,
+    ) -> dict:
+        """
+        Register a beacon with the orchestrator.
+
+        Takes the same arguments and returns the same data as
+        ``BeaconRegistrationClient.register_beacon``.
+
+        Raises:
+            grpc.RpcError: If registration fails
+        """
+        if not self.stub:
+            raise RuntimeError("Client not connected. Call connect() first.")
+
+        request = _build_registration_request(
+            entity_id=entity_id,
+            device_id=device_id,
+            device_type=device_type,
+            public_key_pem=public_key_pem,
+            firmware_version=firmware_version,
+            hardware_revision=hardware_revision,
+            capabilities=capabilities,
+            area_id=area_id,
+        )
+
+        response = await self.stub.RegisterBeacon(request)
+
+        return _handle_registration_response(response)
+
+
+def _build_registration_request(
+    entity_id: str,
+    device_id: str,
+    device_type: str,
+    public_key_pem: str,
+    firmware_version: str,
+    hardware_revision: str,
+    capabilities: List[str],
+    area_id: Optional[str] = None,
+) -> "sync_pb2.BeaconRegistrationRequest":
+    """Build a BeaconRegistrationRequest from registration arguments."""
+    # Prepare location if area_id provided
+    location = None
+    if area_id:
+        location = sync_pb2.BeaconLocation(
+            area_id=area_id,
+            coordinates=sync_pb2.Location(x=0.0, y=0.0, z=0.0, floor=""),
+        )
+
+    return sync_pb2.BeaconRegistrationRequest(
+        entity_id=entity_id,
+        device_id=device_id,
+        device_type=device_type,
+        capabilities=capabilities,
+        public_key=public_key_pem,
+        firmware_version=firmware_version,
+        hardware_revision=hardware_revision,
+        location=location,
+        registered_at=Timestamp(seconds=int(time.time())),
+    )
+
+
+def _handle_registration_response(
+    response: "sync_pb2.BeaconRegistrationResponse",
+) -> dict:
+    """Report a registration response and convert it to a dictionary."""
+    # Check if approved
+    if not response.approved:
+        raise RuntimeError("Beacon registration was not approved by orchestrator")
+
+    print("   ✅ Beacon approved by orchestrator")
+    print(f"      Beacon ID: {response.beacon_id}")
+    print(f"      Entity ID: {response.entity_id}")
+    print(f"      Sync interval: {response.sync_interval_seconds} seconds")
+
+    if response.firmware_update_available:
+        print("      ⚠️  Firmware update available")
+        if response.latest_firmware:
+            print(f"         Latest version: {response.latest_firmware.version}")
+
+    return {
+        "beacon_id": response.beacon_id,
+        "entity_id": response.entity_id,
+        "approved": response.approved,
+        "sync_interval_seconds": response.sync_interval_seconds,
+        "firmware_update_available": response.firmware_update_available,
+    }
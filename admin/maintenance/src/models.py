@@ -1,12 +1,20 @@
 """Data models for key metadata and beacon registration."""
 
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional
 
+# orjson is an optional speedup for reading large directories of metadata
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@dataclass(slots=True)
 class KeyMetadata:
     """
     Metadata for generated cryptographic keys.
@@ -20,6 +28,7 @@ class KeyMetadata:
     generated_at: str
     fused: bool = False
     chip_info: Optional[str] = None
+    public_key_pem: Optional[str] = None
 
     def to_json(self) -> str:
         """Serialize metadata to JSON string."""
@@ -31,14 +40,28 @@ class KeyMetadata:
                 "generated_at": self.generated_at,
                 "fused": self.fused,
                 "chip_info": self.chip_info,
+                "public_key_pem": self.public_key_pem,
             },
             indent=2,
         )
 
+    def to_json_compact(self) -> str:
+        """Serialize metadata to a single-line JSON string without whitespace."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
     @classmethod
     def from_json(cls, json_str: str) -> "KeyMetadata":
         """Deserialize metadata from JSON string."""
-        data = json.loads(json_str)
+        return cls._from_dict(_json_loads(json_str))
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "KeyMetadata":
+        """Deserialize metadata from UTF-8 JSON bytes without decoding first."""
+        return cls._from_dict(_json_loads(raw))
+
+    @classmethod
+    def _from_dict(cls, data: dict) -> "KeyMetadata":
+        """Build metadata from a parsed JSON object."""
         return cls(
             key_name=data["key_name"],
             private_key_file=data["private_key_file"],
@@ -46,14 +69,15 @@ class KeyMetadata:
             generated_at=data["generated_at"],
             fused=data.get("fused", False),
             chip_info=data.get("chip_info"),
+            public_key_pem=data.get("public_key_pem"),
         )
 
     @classmethod
     def from_file(cls, path: Path) -> "KeyMetadata":
         """Load metadata from JSON file."""
-        return cls.from_json(path.read_text())
+        return cls.from_bytes(path.read_bytes())
 
-    def save(self, path: Path) -> None:
-        """Save metadata to JSON file."""
+    def save(self, path: Path, compact: bool = False) -> None:
+        """Save metadata to JSON file, pretty-printed unless compact is set."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.to_json())
+        path.write_text(self.to_json_compact() if compact else self.to_json())
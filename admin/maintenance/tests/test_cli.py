@@ -0,0 +1,131 @@
+"""Tests for the maintenance CLI commands."""
+
+import asyncio
+
+from click.testing import CliRunner
+
+from src import cli
+from src.models import KeyMetadata
+
+
+def _write_metadata(keys_dir, count):
+    """Write ``count`` metadata files and return their paths in sorted order."""
+    paths = []
+    for i in range(count):
+        path = keys_dir / f"key_{i}_metadata.json"
+        KeyMetadata(
+            key_name=f"key_{i}",
+            private_key_file=f"key_{i}_private.bin",
+            public_key_hex="04" + "a1" * 32 + "b2" * 32,
+            generated_at="2025-01-15T10:30:00Z",
+            fused=False,
+            chip_info=None,
+            public_key_pem=f"PEM {i}",
+        ).save(path)
+        paths.append(path)
+    return paths
+
+
+class FakeAsyncClient:
+    """Stand-in for BeaconRegistrationClientAsync that records registrations."""
+
+    def __init__(self, orchestrator_addr, fail_pems=()):
+        self.orchestrator_addr = orchestrator_addr
+        self.fail_pems = set(fail_pems)
+        self.registered = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def connect(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    async def register_beacon(self, device_id, public_key_pem, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if public_key_pem in self.fail_pems:
+            raise RuntimeError("rejected")
+        self.registered.append((device_id, public_key_pem))
+        return {"approved": True}
+
+
+def _patch_client(mocker, **kwargs):
+    """Replace the async client class and return the instance the CLI will use."""
+    fake = FakeAsyncClient("localhost:50051", **kwargs)
+    mocker.patch.object(
+        cli.grpc_client, "BeaconRegistrationClientAsync", return_value=fake
+    )
+    return fake
+
+
+def test_register_beacons_batch_reports_device_ids(mocker, temp_keys_dir):
+    """Test each metadata file is printed next to the device ID it got."""
+    paths = _write_metadata(temp_keys_dir, 3)
+    fake = _patch_client(mocker)
+
+    result = CliRunner().invoke(
+        cli.main,
+        ["register-beacons-batch", "-d", str(temp_keys_dir), "-e", "mall-123"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert fake.closed
+    assert sorted(pem for _, pem in fake.registered) == ["PEM 0", "PEM 1", "PEM 2"]
+    device_ids = dict((pem, device_id) for device_id, pem in fake.registered)
+    for i, path in enumerate(paths):
+        assert f"{path.name} → Device ID: {device_ids[f'PEM {i}']}" in result.output
+    assert "Registered 3/3 beacons" in result.output
+
+
+def test_register_beacons_batch_bounds_concurrency(mocker, temp_keys_dir):
+    """Test no more than --concurrency registrations run at once."""
+    _write_metadata(temp_keys_dir, 6)
+    fake = _patch_client(mocker)
+
+    result = CliRunner().invoke(
+        cli.main,
+        [
+            "register-beacons-batch",
+            "-d",
+            str(temp_keys_dir),
+            "-e",
+            "mall-123",
+            "--concurrency",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(fake.registered) == 6
+    assert fake.max_in_flight == 2
+
+
+def test_register_beacons_batch_reports_failures(mocker, temp_keys_dir):
+    """Test a failed registration is reported and sets a non-zero exit code."""
+    paths = _write_metadata(temp_keys_dir, 2)
+    _patch_client(mocker, fail_pems={"PEM 1"})
+
+    result = CliRunner().invoke(
+        cli.main,
+        ["register-beacons-batch", "-d", str(temp_keys_dir), "-e", "mall-123"],
+    )
+
+    assert result.exit_code == 1
+    assert f"{paths[0].name} → Device ID:" in result.output
+    assert f"{paths[1].name}: rejected" in result.output
+    assert "Registered 1/2 beacons" in result.output
+
+
+def test_register_beacons_batch_requires_metadata(temp_keys_dir):
+    """Test an empty directory fails before connecting."""
+    result = CliRunner().invoke(
+        cli.main,
+        ["register-beacons-batch", "-d", str(temp_keys_dir), "-e", "mall-123"],
+    )
+
+    assert result.exit_code == 1
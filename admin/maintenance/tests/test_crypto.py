@@ -1,5 +1,13 @@
 """Tests for cryptographic key generation and management."""
 
+import re
+import stat
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 from src import crypto
 
 
@@ -19,7 +27,7 @@ def test_generate_p256_key_pair():
     # Public key hex should be 130 characters
     assert len(public_key_hex) == 130
     assert public_key_hex.startswith("04")
-    assert all(c in "0123456789abcdef" for c in public_key_hex)
+    assert re.fullmatch(r"[0-9a-f]+", public_key_hex)
 
 
 def test_public_key_to_pem():
@@ -36,13 +44,22 @@ def test_public_key_to_pem():
     assert isinstance(pem, str)
 
 
+def test_crypto_import_is_lazy():
+    """Test importing the CLI modules does not load cryptography."""
+    code = "import sys, src.crypto; sys.exit('cryptography' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).parent.parent
+    )
+    assert result.returncode == 0
+
+
 def test_generate_device_id():
     """Test device ID generation."""
     device_id = crypto.generate_device_id()
 
     # Should be 24 characters (12 bytes in hex)
     assert len(device_id) == 24
-    assert all(c in "0123456789abcdef" for c in device_id)
+    assert re.fullmatch(r"[0-9a-f]+", device_id)
 
     # Multiple calls should generate different IDs
     device_id2 = crypto.generate_device_id()
@@ -61,13 +78,30 @@ def test_save_private_key(temp_keys_dir):
     assert output_path.read_bytes() == key_bytes
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+def test_save_batch(tmp_path):
+    """Test batch file writes create directories and owner-only files."""
+    files = [
+        (tmp_path / "a" / "one.bin", b"1" * 32),
+        (tmp_path / "a" / "two.json", b"{}"),
+        (tmp_path / "b" / "three.bin", b""),
+    ]
+
+    crypto.save_batch(files)
+
+    for path, payload in files:
+        assert path.read_bytes() == payload
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
 def test_get_timestamp_rfc3339():
     """Test RFC 3339 timestamp generation."""
     timestamp = crypto.get_timestamp_rfc3339()
 
-    # Verify format
-    assert "T" in timestamp
-    assert timestamp.endswith("Z") or "+" in timestamp or "-" in timestamp
+    # Verify format: second precision, UTC designator
+    assert len(timestamp) == len("2025-01-15T10:30:00Z")
+    assert timestamp[10] == "T"
+    assert timestamp.endswith("Z")
 
     # Verify can be parsed
     from datetime import datetime
@@ -104,3 +138,77 @@ def test_public_key_round_trip():
     )
 
     assert loaded_bytes == public_key_bytes
+
+
+def test_generate_p256_key_pairs():
+    """Test batch P-256 key pair generation."""
+    n = 4
+    private_keys, public_keys = crypto.generate_p256_key_pairs(n)
+
+    assert len(private_keys) == n * crypto.PRIVATE_KEY_SIZE
+    assert len(public_keys) == n * crypto.PUBLIC_KEY_SIZE
+
+    # Every public key is uncompressed and every private key is distinct
+    for i in range(n):
+        assert public_keys[i * crypto.PUBLIC_KEY_SIZE] == 0x04
+
+    private_set = {
+        private_keys[i * crypto.PRIVATE_KEY_SIZE : (i + 1) * crypto.PRIVATE_KEY_SIZE]
+        for i in range(n)
+    }
+    assert len(private_set) == n
+
+    # Empty batch yields empty buffers
+    assert crypto.generate_p256_key_pairs(0) == (b"", b"")
+
+
+def test_generate_p256_key_pairs_parallel():
+    """Test parallel batch key generation keeps the packed layout."""
+    n = 10
+    private_keys, public_keys = crypto.generate_p256_key_pairs_parallel(n, workers=2)
+
+    assert len(private_keys) == n * crypto.PRIVATE_KEY_SIZE
+    assert len(public_keys) == n * crypto.PUBLIC_KEY_SIZE
+
+    private_set = {
+        private_keys[i * crypto.PRIVATE_KEY_SIZE : (i + 1) * crypto.PRIVATE_KEY_SIZE]
+        for i in range(n)
+    }
+    assert len(private_set) == n
+
+
+def test_generate_p256_key_pairs_parallel_rejects_zero_workers():
+    """Test an explicit worker count of zero is rejected, not defaulted."""
+    with pytest.raises(ValueError):
+        crypto.generate_p256_key_pairs_parallel(4, workers=0)
+
+
+def test_public_key_to_pem_fast_matches_slow_path():
+    """Test the hand-built SPKI PEM is byte-identical to cryptography's."""
+    _, public_key_bytes, _ = crypto.generate_p256_key_pair()
+
+    assert crypto.public_key_to_pem_fast(public_key_bytes) == crypto.public_key_to_pem(
+        public_key_bytes
+    )
+
+    # Compressed or truncated points are rejected
+    with pytest.raises(ValueError):
+        crypto.public_key_to_pem_fast(b"\x02" + public_key_bytes[1:33])
+    with pytest.raises(ValueError):
+        crypto.public_key_to_pem_fast(public_key_bytes[:-1])
+
+
+def test_generate_p256_key_pairs_cython():
+    """Test the compiled batch loop (or its fallback) keeps the packed layout."""
+    n = 5
+    private_keys, public_keys = crypto.generate_p256_key_pairs_cython(n)
+
+    assert len(private_keys) == n * crypto.PRIVATE_KEY_SIZE
+    assert len(public_keys) == n * crypto.PUBLIC_KEY_SIZE
+
+    for i in range(n):
+        public_bytes = public_keys[
+            i * crypto.PUBLIC_KEY_SIZE : (i + 1) * crypto.PUBLIC_KEY_SIZE
+        ]
+        # Round-trips through cryptography, which validates the point
+        assert crypto.public_key_to_pem(public_bytes)
@@ -0,0 +1,54 @@
+"""Tests for the native libcrypto key generation backend."""
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from src import crypto, crypto_native
+
+pytestmark = pytest.mark.skipif(
+    not crypto_native.is_available(), reason="libcrypto not available"
+)
+
+
+def test_native_generate_p256_key_pairs():
+    """Test native key pairs are valid P-256 keys in the packed layout."""
+    n = 3
+    private_keys, public_keys = crypto_native.generate_p256_key_pairs(n)
+
+    assert len(private_keys) == n * crypto.PRIVATE_KEY_SIZE
+    assert len(public_keys) == n * crypto.PUBLIC_KEY_SIZE
+
+    for i in range(n):
+        private_bytes = private_keys[
+            i * crypto.PRIVATE_KEY_SIZE : (i + 1) * crypto.PRIVATE_KEY_SIZE
+        ]
+        public_bytes = public_keys[
+            i * crypto.PUBLIC_KEY_SIZE : (i + 1) * crypto.PUBLIC_KEY_SIZE
+        ]
+
+        # The public key must match the one derived from the private scalar
+        private_key = ec.derive_private_key(
+            int.from_bytes(private_bytes, "big"), ec.SECP256R1()
+        )
+        expected = private_key.public_key().public_numbers()
+        assert public_bytes[0] == 0x04
+        assert int.from_bytes(public_bytes[1:33], "big") == expected.x
+        assert int.from_bytes(public_bytes[33:], "big") == expected.y
+
+
+def test_crypto_uses_native_backend_when_enabled(monkeypatch):
+    """Test NAVIGN_NATIVE_KEYGEN routes batch generation to libcrypto."""
+    monkeypatch.setenv("NAVIGN_NATIVE_KEYGEN", "1")
+    called = []
+    original = crypto_native.generate_p256_key_pairs
+
+    def spy(n):
+        called.append(n)
+        return original(n)
+
+    monkeypatch.setattr(crypto_native, "generate_p256_key_pairs", spy)
+
+    private_keys, _ = crypto.generate_p256_key_pairs(2)
+
+    assert called == [2]
+    assert len(private_keys) == 2 * crypto.PRIVATE_KEY_SIZE
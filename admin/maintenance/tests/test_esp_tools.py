@@ -1,5 +1,9 @@
 """Tests for ESP tool wrappers."""
 
+import re
+import subprocess
+import sys
+
 import pytest
 
 from src import esp_tools
@@ -13,6 +17,31 @@ def test_check_espefuse_available():
     assert isinstance(result, bool)
 
 
+def test_check_espefuse_available_is_cached(mocker):
+    """Test the espefuse probe only runs once per process."""
+    esp_tools.check_espefuse_available.cache_clear()
+    which = mocker.patch("src.esp_tools.shutil.which", return_value="/bin/espefuse.py")
+
+    assert esp_tools.check_espefuse_available() is True
+    assert esp_tools.check_espefuse_available() is True
+    assert which.call_count == 1
+
+    esp_tools.check_espefuse_available.cache_clear()
+
+
+def test_check_espefuse_available_uses_import_probe(mocker):
+    """Test an importable espefuse module is detected without a subprocess."""
+    esp_tools.check_espefuse_available.cache_clear()
+    mocker.patch("src.esp_tools.shutil.which", return_value=None)
+    mocker.patch("src.esp_tools.importlib.util.find_spec", return_value=object())
+    run = mocker.patch("src.esp_tools.subprocess.run")
+
+    assert esp_tools.check_espefuse_available() is True
+    run.assert_not_called()
+
+    esp_tools.check_espefuse_available.cache_clear()
+
+
 def test_detect_flash_tool_returns_string_or_raises():
     """Test that detect_flash_tool either returns a string or raises ESPToolNotFoundError."""
     try:
@@ -29,7 +58,7 @@ def test_generate_device_id_format():
 
     device_id = generate_device_id()
     assert len(device_id) == 24
-    assert all(c in "0123456789abcdef" for c in device_id)
+    assert re.fullmatch(r"[0-9a-f]+", device_id)
 
 
 @pytest.mark.integration
@@ -44,3 +73,33 @@ def test_get_chip_info_requires_hardware():
 def test_fuse_key_requires_hardware(temp_keys_dir):
     """Test eFuse programming (requires actual hardware)."""
     pytest.skip("Requires ESP32-C3 hardware connected")
+
+
+def test_fuse_key_to_efuse_streams_output(temp_keys_dir, mocker, capsys):
+    """Test eFuse output is printed line by line and failures raise."""
+    real_popen = subprocess.Popen
+    key_file = temp_keys_dir / "key.bin"
+    key_file.write_bytes(b"a" * 32)
+
+    mocker.patch("src.esp_tools.check_espefuse_available", return_value=True)
+    script = "print('Burn keys'); print(''); print('Done')"
+    mocker.patch(
+        "src.esp_tools.subprocess.Popen",
+        side_effect=lambda cmd, **kwargs: real_popen(
+            [sys.executable, "-c", script], **kwargs
+        ),
+    )
+
+    esp_tools.fuse_key_to_efuse(key_file, port="/dev/ttyUSB0", force=True)
+
+    out = capsys.readouterr().out
+    assert "   Burn keys\n   Done\n" in out
+
+    mocker.patch(
+        "src.esp_tools.subprocess.Popen",
+        side_effect=lambda cmd, **kwargs: real_popen(
+            [sys.executable, "-c", "raise SystemExit(2)"], **kwargs
+        ),
+    )
+    with pytest.raises(subprocess.CalledProcessError):
+        esp_tools.fuse_key_to_efuse(key_file, force=True)
@@ -0,0 +1,65 @@
+"""Tests for the beacon registration gRPC clients."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from proto import sync_pb2
+from src import grpc_client
+
+
+def _registration_args(**overrides):
+    """Keyword arguments for register_beacon with test defaults."""
+    args = {
+        "entity_id": "mall-123",
+        "device_id": "00" * 12,
+        "device_type": "Pathway",
+        "public_key_pem": "-----BEGIN PUBLIC KEY-----\n...",
+        "firmware_version": "0.1.0",
+        "hardware_revision": "v1.0",
+        "capabilities": ["UnlockGate"],
+    }
+    args.update(overrides)
+    return args
+
+
+@pytest.mark.asyncio
+async def test_async_register_requires_connect():
+    """Test registering before connect() raises."""
+    client = grpc_client.BeaconRegistrationClientAsync("localhost:50051")
+
+    with pytest.raises(RuntimeError, match="not connected"):
+        await client.register_beacon(**_registration_args())
+
+
+@pytest.mark.asyncio
+async def test_async_register_beacon(mocker):
+    """Test the async client sends the request and converts the response."""
+    client = grpc_client.BeaconRegistrationClientAsync("localhost:50051")
+    client.stub = mocker.Mock()
+    client.stub.RegisterBeacon = AsyncMock(
+        return_value=sync_pb2.BeaconRegistrationResponse(
+            approved=True, beacon_id="beacon-1", entity_id="mall-123"
+        )
+    )
+
+    result = await client.register_beacon(**_registration_args(area_id="area-1"))
+
+    request = client.stub.RegisterBeacon.call_args.args[0]
+    assert request.device_id == "00" * 12
+    assert request.location.area_id == "area-1"
+    assert result["beacon_id"] == "beacon-1"
+    assert result["approved"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_register_beacon_not_approved(mocker):
+    """Test a rejected registration raises."""
+    client = grpc_client.BeaconRegistrationClientAsync("localhost:50051")
+    client.stub = mocker.Mock()
+    client.stub.RegisterBeacon = AsyncMock(
+        return_value=sync_pb2.BeaconRegistrationResponse(approved=False)
+    )
+
+    with pytest.raises(RuntimeError, match="not approved"):
+        await client.register_beacon(**_registration_args())
@@ -117,3 +117,56 @@ def test_key_metadata_update_fused_status(temp_keys_dir):
     updated = KeyMetadata.from_file(metadata_path)
     assert updated.fused is True
     assert updated.chip_info == "ESP32-C3 detected"
+
+
+def test_key_metadata_public_key_pem_round_trip():
+    """Test cached PEM survives serialization and defaults to None."""
+    pem = "-----BEGIN PUBLIC KEY-----\nAAAA\n-----END PUBLIC KEY-----\n"
+    metadata = KeyMetadata(
+        key_name="test_key",
+        private_key_file="test_key_private.bin",
+        public_key_hex="04aabbcc",
+        generated_at="2025-01-15T10:30:00Z",
+        public_key_pem=pem,
+    )
+
+    loaded = KeyMetadata.from_json(metadata.to_json())
+    assert loaded.public_key_pem == pem
+
+    # Metadata written before the field existed still loads
+    legacy = json.loads(metadata.to_json())
+    del legacy["public_key_pem"]
+    assert KeyMetadata.from_json(json.dumps(legacy)).public_key_pem is None
+
+
+def test_key_metadata_compact_json(temp_keys_dir):
+    """Test compact serialization holds the same data on a single line."""
+    metadata = KeyMetadata(
+        key_name="test_key",
+        private_key_file="test_key_private.bin",
+        public_key_hex="04aabbcc",
+        generated_at="2025-01-15T10:30:00Z",
+    )
+
+    compact = metadata.to_json_compact()
+    assert "\n" not in compact
+    assert " " not in compact
+    assert json.loads(compact) == json.loads(metadata.to_json())
+
+    metadata_path = temp_keys_dir / "metadata.json"
+    metadata.save(metadata_path, compact=True)
+    assert metadata_path.read_text() == compact
+    assert KeyMetadata.from_file(metadata_path) == metadata
+
+
+def test_key_metadata_from_bytes():
+    """Test metadata can be parsed straight from raw file bytes."""
+    metadata = KeyMetadata(
+        key_name="test_key",
+        private_key_file="test_key_private.bin",
+        public_key_hex="04aabbcc",
+        generated_at="2025-01-15T10:30:00Z",
+        chip_info="ESP32-C3 detected",
+    )
+
+    assert KeyMetadata.from_bytes(metadata.to_json().encode("utf-8")) == metadata
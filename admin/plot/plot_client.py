@@ -6,15 +6,155 @@ This client implements polygon extraction from floor plans and submits
 the results to the orchestrator.
 """
 
+import asyncio
+import dataclasses
+import functools
+import os
 import time
+import itertools
 import logging
-from typing import Optional
+import multiprocessing
+import struct
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Optional
 import cv2
 import numpy as np
 import grpc
+from google.protobuf.descriptor import FieldDescriptor
 
 from proto import task_pb2, task_pb2_grpc
 
+# pyspng (SIMD libspng) and PyTurboJPEG are optional faster decoders; cv2 is
+# used when they are missing
+try:
+    import pyspng
+except ImportError:
+    pyspng = None
+
+try:
+    from turbojpeg import TurboJPEG
+
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # RuntimeError: the module is installed but libturbojpeg is not
+    _turbojpeg = None
+
+# nvImageCodec decodes whole batches on the GPU; hosts without CUDA use the
+# per-image CPU decoders above
+try:
+    from nvidia import nvimgcodec
+
+    _nvimgcodec_decoder = nvimgcodec.Decoder()
+except (ImportError, RuntimeError):
+    # RuntimeError: the module is installed but no CUDA device is usable
+    _nvimgcodec_decoder = None
+
+
+@dataclass(slots=True, frozen=True)
+class ExtractionParams:
+    """
+    Extraction settings with defaults applied, used internally in place of
+    PlotExtractionConfig.
+
+    Field defaults are the extraction defaults; see PlotExtractionConfig for
+    the meaning of each field.
+    """
+
+    blur_kernel_size: float = 5.0
+    threshold_value: int = 127
+    threshold_type: int = 0
+    min_area: float = 100.0
+    max_area: float = 0.0
+    epsilon_factor: float = 0.01
+    apply_morphology: bool = True
+    morph_kernel_size: int = 5
+    use_canny: bool = False
+    canny_low: int = 50
+    canny_high: int = 150
+    # Detect on an image this many times smaller (0: use max_dimension); set
+    # from the client's downscale option, not from the config message
+    downscale: float = 0.0
+
+    @classmethod
+    def from_proto(
+        cls, config: Optional[task_pb2.PlotExtractionConfig]
+    ) -> "ExtractionParams":
+        """
+        Build params from a config message.
+
+        Numeric fields that are zero or negative use their defaults.
+        use_canny, threshold_type and max_area are taken as given.
+        apply_morphology stays on unless the message records that it was
+        explicitly set to False, which needs a field with presence.
+
+        Args:
+            config: User-provided configuration (may be None)
+
+        Returns:
+            Params with defaults applied
+        """
+        if config is None:
+            return _DEFAULT_PARAMS
+        # Fields missing from older config messages keep their defaults
+        overrides = {}
+        for name in _DEFAULTED_FIELDS:
+            value = getattr(config, name, 0)
+            if value > 0 and value != getattr(_DEFAULT_PARAMS, name):
+                overrides[name] = value
+        for name in _PLAIN_FIELDS:
+            value = getattr(config, name, None)
+            if value is not None and value != getattr(_DEFAULT_PARAMS, name):
+                overrides[name] = value
+        for name in _PRESENCE_FIELDS:
+            value = getattr(config, name, None)
+            if value is None or value == getattr(_DEFAULT_PARAMS, name):
+                continue
+            if _has_presence(config, name) and config.HasField(name):
+                overrides[name] = value
+        if not overrides:
+            return _DEFAULT_PARAMS
+        return dataclasses.replace(_DEFAULT_PARAMS, **overrides)
+
+
+# Numeric fields where zero (unset in proto3) or a negative value means default
+_DEFAULTED_FIELDS = (
+    "blur_kernel_size",
+    "threshold_value",
+    "min_area",
+    "epsilon_factor",
+    "morph_kernel_size",
+    "canny_low",
+    "canny_high",
+)
+
+# Fields whose zero value is meaningful, so they are used as given
+_PLAIN_FIELDS = ("threshold_type", "max_area", "use_canny")
+
+# Toggles that default to on. Without presence an unset field reads False,
+# the same as an explicit False, so only a field with presence can turn one off
+_PRESENCE_FIELDS = ("apply_morphology",)
+
+
+def _has_presence(config, name: str) -> bool:
+    """
+    Check whether a config message tracks presence for a field.
+
+    Args:
+        config: Config message
+        name: Field name
+
+    Returns:
+        True if the field is declared with presence (e.g. proto3 ``optional``)
+    """
+    fields = getattr(getattr(config, "DESCRIPTOR", None), "fields_by_name", {})
+    field = fields.get(name)
+    return field is not None and field.has_presence
+
+# Shared by every call that does not override anything; params are immutable
+_DEFAULT_PARAMS = ExtractionParams()
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +162,613 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Image payloads make protobuf (de)serialization a hot path; the pure-Python
+# runtime is several times slower than upb, so flag it early
+try:
+    from google.protobuf.internal import api_implementation
+
+    _PROTOBUF_BACKEND = api_implementation.Type()
+except ImportError:
+    _PROTOBUF_BACKEND = "unknown"
+
+if _PROTOBUF_BACKEND == "python":
+    logger.warning(
+        "protobuf is using the pure-Python backend; unset "
+        "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION or set it to 'upb' for faster "
+        "image serialization"
+    )
+
+# Floor plans routinely exceed gRPC's 4 MiB default message limit, the largest
+# HTTP/2 frame size cuts per-frame overhead on those payloads, and keepalive
+# keeps the connection warm between sparse batches. A PlotService server
+# should be built with the same options.
+_MAX_MESSAGE_LENGTH = 64 * 1024 * 1024
+_MAX_FRAME_SIZE = 2**24 - 1
+_CHANNEL_OPTIONS = (
+    ("grpc.max_receive_message_length", _MAX_MESSAGE_LENGTH),
+    ("grpc.max_send_message_length", _MAX_MESSAGE_LENGTH),
+    ("grpc.http2.max_frame_size", _MAX_FRAME_SIZE),
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+)
+
+# gRPC channels are thread-safe and multiplex concurrent RPCs over one HTTP/2
+# connection, so a single channel per (address, options) is shared by every
+# client in the process instead of reconnecting per instance.
+_CHANNEL_CACHE: dict[tuple, grpc.Channel] = {}
+_CHANNEL_LOCK = threading.Lock()
+
+
+def _new_channel(
+    address: str, options: tuple = (), compression: Optional[grpc.Compression] = None
+) -> grpc.Channel:
+    """
+    Open a channel with the standard options plus any extra ones.
+
+    Args:
+        address: Server address
+        options: Extra gRPC channel options as (key, value) pairs
+        compression: Channel-wide compression (default: none)
+
+    Returns:
+        New gRPC channel
+    """
+    return grpc.insecure_channel(
+        address, options=list(_CHANNEL_OPTIONS + options), compression=compression
+    )
+
+
+def _get_channel(
+    address: str, options: tuple = (), compression: Optional[grpc.Compression] = None
+) -> grpc.Channel:
+    """
+    Get the shared channel for an address, creating it on first use.
+
+    Args:
+        address: Server address
+        options: Extra gRPC channel options as (key, value) pairs
+        compression: Channel-wide compression (default: none)
+
+    Returns:
+        Shared gRPC channel
+    """
+    options = tuple(sorted(options, key=lambda option: option[0]))
+    key = (address, options, compression)
+    with _CHANNEL_LOCK:
+        channel = _CHANNEL_CACHE.get(key)
+        if channel is None:
+            channel = _new_channel(address, options, compression)
+            _CHANNEL_CACHE[key] = channel
+        return channel
+
+
+def shutdown_channels():
+    """Close every shared channel. Call once at process exit."""
+    with _CHANNEL_LOCK:
+        channels = list(_CHANNEL_CACHE.values())
+        _CHANNEL_CACHE.clear()
+    for channel in channels:
+        channel.close()
+
+
+# Worker processes for batch_extract(use_processes=True), created on first use
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared extraction process pool, creating it on first use.
+
+    Workers are started with forkserver (spawn where unavailable) rather than
+    fork: forking a process that holds live gRPC channels is unsafe.
+
+    Returns:
+        Process pool with one worker per CPU
+    """
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            _PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=context
+            )
+        return _PROCESS_POOL
+
+
+def shutdown_process_pool():
+    """Stop the extraction worker processes, if any were started."""
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        pool, _PROCESS_POOL = _PROCESS_POOL, None
+    if pool is not None:
+        pool.shutdown()
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start-of-frame markers; C4 (DHT), C8 (JPG) and CC (DAC) share the range
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _peek_image_size(data: bytes) -> Optional[tuple[int, int]]:
+    """
+    Read image dimensions from the PNG or JPEG header without decoding pixels.
+
+    Args:
+        data: Encoded image data
+
+    Returns:
+        Tuple of (width, height), or None if the format is not recognized
+    """
+    if data[:8] == _PNG_SIGNATURE and data[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", data[16:24])
+        return width, height
+
+    if data[:2] == b"\xff\xd8":
+        i = 2
+        while i + 9 <= len(data):
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker == 0xFF:
+                # Fill byte before a marker
+                i += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                # Standalone marker without a length field
+                i += 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                height, width = struct.unpack(">HH", data[i + 5 : i + 9])
+                return width, height
+            (length,) = struct.unpack(">H", data[i + 2 : i + 4])
+            i += 2 + length
+
+    return None
+
+
+_EXIF_HEADER = b"Exif\x00\x00"
+_EXIF_ORIENTATION_TAG = 0x0112
+
+
+def _jpeg_orientation(data: bytes) -> int:
+    """
+    Read the EXIF orientation of JPEG data without decoding pixels.
+
+    Args:
+        data: Encoded JPEG data
+
+    Returns:
+        EXIF orientation (1-8); 1 (upright) if the data has none
+    """
+    i = 2
+    while i + 4 <= len(data) and data[i] == 0xFF:
+        marker = data[i + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            # Standalone marker without a length field
+            i += 2
+            continue
+        if marker == 0xDA:
+            # Start of scan; metadata segments all come before it
+            break
+        (length,) = struct.unpack(">H", data[i + 2 : i + 4])
+        if marker == 0xE1 and data[i + 4 : i + 10] == _EXIF_HEADER:
+            return _tiff_orientation(data[i + 10 : i + 2 + length])
+        i += 2 + length
+    return 1
+
+
+def _tiff_orientation(tiff: bytes) -> int:
+    """
+    Find the orientation tag in the first IFD of an EXIF TIFF block.
+
+    Args:
+        tiff: TIFF block following the APP1 Exif header
+
+    Returns:
+        EXIF orientation (1-8); 1 if the tag is missing or malformed
+    """
+    endian = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+    if endian is None or len(tiff) < 8:
+        return 1
+    (offset,) = struct.unpack(endian + "I", tiff[4:8])
+    if offset + 2 > len(tiff):
+        return 1
+    (count,) = struct.unpack(endian + "H", tiff[offset : offset + 2])
+    # Each IFD entry is tag, type, count and a 4-byte value; a SHORT value
+    # sits in the first two bytes
+    end = min(offset + 2 + 12 * count, len(tiff) - 11)
+    for entry in range(offset + 2, end, 12):
+        tag, _, _, value = struct.unpack(endian + "HHIH", tiff[entry : entry + 10])
+        if tag == _EXIF_ORIENTATION_TAG:
+            return value
+    return 1
+
+
+# Channel conversions from pyspng's RGB(A)/gray output to cv2's 3-channel BGR
+_SPNG_TO_BGR = {1: cv2.COLOR_GRAY2BGR, 3: cv2.COLOR_RGB2BGR, 4: cv2.COLOR_RGBA2BGR}
+
+
+# cv2.imdecode flags for JPEG DCT-domain downscaling by 1, 2, 4 and 8
+_REDUCED_COLOR_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def _decode_image(data: bytes, reduction: int = 1) -> Optional[np.ndarray]:
+    """
+    Decode PNG or JPEG data to a 3-channel BGR image.
+
+    Dispatches on the file signature to libspng (pyspng) for PNG and
+    libjpeg-turbo (PyTurboJPEG) for JPEG when installed, and to
+    cv2.imdecode otherwise. Output matches cv2.imdecode(IMREAD_COLOR):
+    TurboJPEG ignores EXIF orientation, so rotated JPEGs go to cv2, which
+    applies it.
+
+    Args:
+        data: Encoded image data
+        reduction: Downscale factor (1, 2, 4 or 8) applied while decoding
+            JPEG data; ignored for other formats
+
+    Returns:
+        Decoded image, or None if the data cannot be decoded
+    """
+    is_jpeg = data[:2] == b"\xff\xd8"
+    try:
+        if _turbojpeg is not None and is_jpeg and _jpeg_orientation(data) == 1:
+            return _turbojpeg.decode(data, scaling_factor=(1, reduction))
+
+        if pyspng is not None and data[:8] == _PNG_SIGNATURE:
+            image = pyspng.load(data)
+            # 16-bit PNGs need cv2's depth conversion
+            if image.dtype == np.uint8:
+                channels = 1 if image.ndim == 2 else image.shape[2]
+                return cv2.cvtColor(image, _SPNG_TO_BGR[channels])
+    except Exception as e:
+        logger.debug("Fast decoder failed, falling back to cv2: %s", e)
+
+    flags = _REDUCED_COLOR_FLAGS[reduction] if is_jpeg else cv2.IMREAD_COLOR
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags)
+
+
+def _decode_image_for_extraction(
+    data: bytes, max_dimension: Optional[int]
+) -> tuple[Optional[np.ndarray], Optional[tuple[int, int]]]:
+    """
+    Decode an image, letting the JPEG decoder do most of the downscale.
+
+    libjpeg scales by 1/2, 1/4 or 1/8 while decoding, for a fraction of the
+    cost of a full-size decode followed by a resize. The largest reduction
+    that keeps the longer side at or above ``max_dimension`` is used, so the
+    extraction downscale still does the final, exact resize.
+
+    Args:
+        data: Encoded image data
+        max_dimension: Target longer side, or None to decode at full size
+
+    Returns:
+        Tuple of (decoded BGR image or None, original (width, height) if the
+        image was decoded at reduced size, else None)
+    """
+    reduction, size = 1, None
+    if max_dimension and data[:2] == b"\xff\xd8":
+        size = _peek_image_size(data)
+        if size is not None:
+            longest = max(size)
+            reduction = next((f for f in (8, 4, 2) if longest // f >= max_dimension), 1)
+
+    image = _decode_image(data, reduction)
+    if image is None or reduction == 1:
+        return image, None
+
+    width, height = size
+    # cv2 applies the EXIF orientation, which may have rotated the image
+    if (image.shape[1] > image.shape[0]) != (width > height):
+        width, height = height, width
+    return image, (width, height)
+
+
+def _decode_files_gpu(paths: list[str]) -> list[Optional[np.ndarray]]:
+    """
+    Decode a batch of image files in one nvImageCodec call.
+
+    Files that cannot be read or decoded come back as None so the caller can
+    retry them on the CPU path, which also reports the error.
+
+    Args:
+        paths: Image file paths
+
+    Returns:
+        Decoded BGR images (or None) in the order of ``paths``
+    """
+    images: list[Optional[np.ndarray]] = [None] * len(paths)
+    if _nvimgcodec_decoder is None:
+        return images
+
+    datas, indices = [], []
+    for i, path in enumerate(paths):
+        try:
+            datas.append(Path(path).read_bytes())
+        except OSError:
+            continue
+        indices.append(i)
+
+    try:
+        decoded = _nvimgcodec_decoder.decode(datas)
+    except Exception as e:
+        logger.debug("GPU batch decode failed, falling back to CPU: %s", e)
+        return images
+
+    for i, image in zip(indices, decoded):
+        if image is not None:
+            # nvImageCodec decodes to interleaved RGB
+            images[i] = cv2.cvtColor(np.asarray(image.cpu()), cv2.COLOR_RGB2BGR)
+    return images
+
+
+# Format name for uncompressed 8-bit BGR pixels (the Image.raw_bgr payload)
+RAW_BGR_FORMAT = "raw_bgr"
+
+
+def _raw_bgr_image(data: bytes, width: int, height: int) -> np.ndarray:
+    """
+    Wrap raw 8-bit BGR pixels as an image without decoding or copying.
+
+    Args:
+        data: Row-major pixels, height x width x 3 bytes
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        Read-only BGR image backed by ``data``
+
+    Raises:
+        ValueError: If the dimensions do not match the data length
+    """
+    if width <= 0 or height <= 0 or len(data) != width * height * 3:
+        raise ValueError(
+            f"Raw BGR data is {len(data)} bytes, expected {width}x{height}x3"
+        )
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_image_file(
+    path: str, mtime_ns: int, size: int, max_dimension: Optional[int] = None
+) -> tuple[bytes, np.ndarray, Optional[tuple[int, int]]]:
+    """
+    Read and decode an image file, cached by path, mtime and size.
+
+    Batch retries and development loops re-extract the same files; a changed
+    file gets a new mtime/size and therefore a fresh entry. The cache is kept
+    small since decoded floor plans are large. The returned image is
+    read-only because it is shared between callers.
+
+    Args:
+        path: Image file path
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        max_dimension: See _decode_image_for_extraction
+
+    Returns:
+        Tuple of (raw file bytes, decoded BGR image, original size if the
+        image was decoded at reduced size)
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file cannot be decoded
+    """
+    data = Path(path).read_bytes()
+    image, original_size = _decode_image_for_extraction(data, max_dimension)
+    if image is None:
+        raise ValueError(f"Failed to read image from {path}")
+    image.flags.writeable = False
+    return data, image, original_size
+
+
+# Scale factors mapping other pixel depths onto 0-255; float images are
+# expected in [0, 1]
+_UINT8_SCALE = {
+    np.dtype(np.uint16): 255.0 / 65535.0,
+    np.dtype(np.float32): 255.0,
+    np.dtype(np.float64): 255.0,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _struct_elem(size: int) -> np.ndarray:
+    """
+    Get the square morphology kernel of a given size.
+
+    Cached so extraction does not allocate a kernel per call; the kernel is
+    read-only and OpenCV only reads it, so it is safe to share across threads.
+
+    Args:
+        size: Kernel side length in pixels
+
+    Returns:
+        size x size uint8 rectangular structuring element
+    """
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
+    kernel.flags.writeable = False
+    return kernel
+
+
+# Wire image of one Polygon.vertices entry: field 1, length-delimited, wrapping
+# a Point with double x (field 1) and double y (field 2)
+_VERTEX_WIRE = np.dtype(
+    [
+        ("tag", "u1"),
+        ("length", "u1"),
+        ("x_tag", "u1"),
+        ("x", "<f8"),
+        ("y_tag", "u1"),
+        ("y", "<f8"),
+    ]
+)
+
+
+def _has_point_vertices(polygon_cls) -> bool:
+    """
+    Check that a Polygon message class matches the layout _VERTEX_WIRE encodes.
+
+    Args:
+        polygon_cls: Generated Polygon message class
+
+    Returns:
+        True if vertices is field 1 of Points with double x = 1 and y = 2
+    """
+    fields = getattr(getattr(polygon_cls, "DESCRIPTOR", None), "fields_by_name", {})
+    vertices = fields.get("vertices")
+    if vertices is None or vertices.number != 1 or vertices.message_type is None:
+        return False
+    point = vertices.message_type.fields_by_name
+    return all(
+        name in point
+        and point[name].number == number
+        and point[name].type == FieldDescriptor.TYPE_DOUBLE
+        for name, number in (("x", 1), ("y", 2))
+    )
+
+
+def _encode_vertices(coords: np.ndarray) -> bytes:
+    """
+    Serialize polygon vertices as repeated Point entries of Polygon field 1.
+
+    Args:
+        coords: N x 2 array of (x, y) coordinates
+
+    Returns:
+        Wire bytes to merge into a Polygon message
+    """
+    wire = np.empty(len(coords), dtype=_VERTEX_WIRE)
+    wire["tag"] = 0x0A
+    wire["length"] = _VERTEX_WIRE.itemsize - 2
+    wire["x_tag"] = 0x09
+    wire["x"] = coords[:, 0]
+    wire["y_tag"] = 0x11
+    wire["y"] = coords[:, 1]
+    return wire.tobytes()
+
+
+def _contour_areas_centroids(
+    contours: tuple[np.ndarray, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the area and centroid of every contour in one vectorized pass.
+
+    Contours are packed into a single point array and reduced per contour
+    with the shoelace formula, matching cv2.contourArea and the centroid
+    from cv2.moments without a Python-level call per contour.
+
+    Args:
+        contours: Contours as returned by cv2.findContours
+
+    Returns:
+        Tuple of (areas, centroid xs, centroid ys); centroids of zero-area
+        contours are (0, 0)
+    """
+    if not contours:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty
+
+    lengths = np.fromiter(
+        (len(contour) for contour in contours), dtype=np.intp, count=len(contours)
+    )
+    starts = np.zeros_like(lengths)
+    np.cumsum(lengths[:-1], out=starts[1:])
+
+    points = np.concatenate(contours).reshape(-1, 2).astype(np.float64)
+    xs, ys = points[:, 0], points[:, 1]
+
+    # Index of each vertex's successor, wrapping around within its contour
+    successors = np.arange(1, len(points) + 1)
+    successors[starts + lengths - 1] = starts
+    next_xs, next_ys = xs[successors], ys[successors]
+
+    cross = xs * next_ys - next_xs * ys
+    signed_areas = 0.5 * np.add.reduceat(cross, starts)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centroid_xs = np.add.reduceat((xs + next_xs) * cross, starts) / (
+            6.0 * signed_areas
+        )
+        centroid_ys = np.add.reduceat((ys + next_ys) * cross, starts) / (
+            6.0 * signed_areas
+        )
+
+    degenerate = signed_areas == 0
+    centroid_xs[degenerate] = 0.0
+    centroid_ys[degenerate] = 0.0
+
+    return np.abs(signed_areas), centroid_xs, centroid_ys
+
+
+class ChannelPool:
+    """
+    Fixed set of channels to one address, handed out round-robin per RPC.
+
+    A single HTTP/2 connection caps concurrent streams and shares one TCP
+    congestion window, so large batches are spread over several connections.
+    Each channel carries a distinct ``grpc.channel_id`` argument so gRPC does
+    not collapse them onto the same subchannel.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        stub_cls,
+        size: int = 1,
+        shared: bool = True,
+        compression: Optional[grpc.Compression] = None,
+    ):
+        """
+        Open the pool.
+
+        Args:
+            address: Server address
+            stub_cls: Generated stub class to bind to each channel
+            size: Number of channels (default: 1)
+            shared: Take channels from the process-wide cache (default: True)
+            compression: Channel-wide compression (default: none)
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+
+        self.shared = shared
+        self.channels: list[grpc.Channel] = []
+        for i in range(size):
+            options = (("grpc.channel_id", i),)
+            if shared:
+                channel = _get_channel(address, options, compression)
+            else:
+                channel = _new_channel(address, options, compression)
+            self.channels.append(channel)
+        self.stubs = [stub_cls(channel) for channel in self.channels]
+        self._counter = itertools.count()
+
+    def next_stub(self):
+        """Return the stub for the next channel in round-robin order."""
+        return self.stubs[next(self._counter) % len(self.stubs)]
+
+    def close(self):
+        """Close the channels unless they belong to the shared cache."""
+        if not self.shared:
+            for channel in self.channels:
+                channel.close()
+
 
 class PlotExtractionClient:
     """
@@ -31,28 +778,89 @@ class PlotExtractionClient:
     polygon extraction functionality for floor plans using OpenCV.
     """
 
-    def __init__(self, orchestrator_address: str = "localhost:50051"):
+    # Message classes bound once for the per-floor paths
+    _Response = task_pb2.ExtractPolygonsResponse
+    _FloorExtraction = task_pb2.FloorExtraction
+    _Stats = task_pb2.PlotProcessingStats
+    _Polygon = task_pb2.Polygon
+
+    # Stats for failed extractions; never mutated, and protobuf copies it
+    # into whichever message it is assigned to
+    _EMPTY_STATS = task_pb2.PlotProcessingStats()
+
+    # Vertices are merged in from their encoded wire form when the message
+    # layout is the one the encoder assumes
+    _wire_vertices = _has_point_vertices(task_pb2.Polygon)
+
+    def __init__(
+        self,
+        orchestrator_address: str = "localhost:50051",
+        shared_channel: bool = True,
+        pool_size: int = 1,
+        compression: Optional[grpc.Compression] = None,
+        use_opencl: bool = False,
+        max_dimension: Optional[int] = 2048,
+        downscale: float = 0.0,
+    ):
         """
         Initialize the plot extraction client.
 
         Args:
             orchestrator_address: Address of the orchestrator server (default: localhost:50051)
+            shared_channel: Reuse the process-wide channels for this address
+                instead of opening dedicated ones (default: True)
+            pool_size: Number of channels batch RPCs are spread over. Each is a
+                separate connection and extraction still runs locally, so
+                keep the default until RPCs are sent (default: 1)
+            compression: Channel-wide compression such as
+                grpc.Compression.Gzip (default: none; PNG and JPEG payloads
+                are already compressed)
+            use_opencl: Run image preprocessing on an OpenCL device through
+                cv2.UMat when one is available (default: False)
+            max_dimension: Downscale images whose longer side exceeds this
+                before extraction; polygons are reported in original pixel
+                coordinates. None disables (default: 2048)
+            downscale: Detect on an image this many times smaller, in place of
+                max_dimension. Values of 1 or less disable (default: 0)
         """
         self.orchestrator_address = orchestrator_address
+        self.shared_channel = shared_channel
+        self.pool_size = pool_size
+        self.compression = compression
+        self.use_opencl = use_opencl
+        self.max_dimension = max_dimension
+        self.downscale = downscale
+        self._scratch = threading.local()
+        self.pool: Optional[ChannelPool] = None
         self.channel: Optional[grpc.Channel] = None
         self.stub: Optional[task_pb2_grpc.OrchestratorServiceStub] = None
 
     def connect(self):
         """Establish connection to the orchestrator gRPC server."""
-        logger.info(f"Connecting to Orchestrator at {self.orchestrator_address}")
-        self.channel = grpc.insecure_channel(self.orchestrator_address)
-        self.stub = task_pb2_grpc.OrchestratorServiceStub(self.channel)
+        logger.info("Connecting to Orchestrator at %s", self.orchestrator_address)
+        self.pool = ChannelPool(
+            self.orchestrator_address,
+            task_pb2_grpc.OrchestratorServiceStub,
+            size=self.pool_size,
+            shared=self.shared_channel,
+            compression=self.compression,
+        )
+        self.channel = self.pool.channels[0]
+        self.stub = self.pool.stubs[0]
         logger.info("Connected to orchestrator successfully")
 
     def close(self):
-        """Close the connection to the orchestrator."""
-        if self.channel:
-            self.channel.close()
+        """
+        Close the connection to the orchestrator.
+
+        Shared channels stay open for other clients; use shutdown_channels()
+        to close them.
+        """
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+            self.channel = None
+            self.stub = None
             logger.info("Connection closed")
 
     def extract_polygons_from_file(
@@ -77,25 +885,41 @@ class PlotExtractionClient:
         if not self.stub:
             raise RuntimeError("Client not connected. Call connect() first.")
 
-        # Read image
-        image = cv2.imread(image_path)
-        if image is None:
-            raise ValueError(f"Failed to read image from {image_path}")
+        return self._extract_file(image_path, entity_id, floor_id, config)
 
-        # Encode image
-        success, encoded = cv2.imencode(".png", image)
-        if not success:
-            raise ValueError("Failed to encode image")
+    def _extract_file(
+        self,
+        image_path: str,
+        entity_id: str,
+        floor_id: str,
+        config: Optional[task_pb2.PlotExtractionConfig] = None,
+    ) -> task_pb2.ExtractPolygonsResponse:
+        """
+        Extract polygons from a floor plan image file, without requiring a
+        connection.
 
-        height, width = image.shape[:2]
+        See extract_polygons_from_file.
+        """
+        # The raw bytes are also what goes on the wire
+        try:
+            stat = os.stat(image_path)
+            data, image, original_size = _load_image_file(
+                image_path, stat.st_mtime_ns, stat.st_size, self.max_dimension
+            )
+        except OSError as e:
+            raise ValueError(f"Failed to read image from {image_path}") from e
 
         # Perform local extraction (Python implementation)
-        logger.info(f"Extracting polygons from {image_path} locally")
-        response = self._perform_local_extraction(image, entity_id, floor_id, config)
+        logger.info("Extracting polygons from %s locally", image_path)
+        response = self._perform_local_extraction(
+            image, entity_id, floor_id, config, original_size
+        )
 
-        # TODO: Optionally send to orchestrator for storage/coordination
+        # TODO: Optionally send to orchestrator for storage/coordination; the
+        # file bytes go out as read, without re-encoding
+        # width, height = _peek_image_size(data)
         # floor_plan_image = task_pb2.FloorPlanImage(
-        #     data=encoded.tobytes(), format="png", width=width, height=height
+        #     data=data, format=image_format, width=width, height=height
         # )
         # request = task_pb2.ExtractPolygonsRequest(
         #     entity_id=entity_id,
@@ -103,7 +927,7 @@ class PlotExtractionClient:
         #     floor_plan=floor_plan_image,
         #     config=config if config else task_pb2.PlotExtractionConfig(),
         # )
-        # orchestrator_response = self.stub.ExtractPolygons(request)
+        # orchestrator_response = self.pool.next_stub().ExtractPolygons(request)
 
         return response
 
@@ -114,16 +938,20 @@ class PlotExtractionClient:
         floor_id: str,
         image_format: str = "png",
         config: Optional[task_pb2.PlotExtractionConfig] = None,
+        width: int = 0,
+        height: int = 0,
     ) -> task_pb2.ExtractPolygonsResponse:
         """
         Extract polygons from floor plan image data.
 
         Args:
-            image_data: Encoded image data
+            image_data: Encoded image data, or raw pixels for 'raw_bgr'
             entity_id: Entity identifier
             floor_id: Floor identifier
-            image_format: Image format ('png' or 'jpeg')
+            image_format: Image format ('png', 'jpeg' or 'raw_bgr')
             config: Optional extraction configuration
+            width: Image width in pixels (required for 'raw_bgr')
+            height: Image height in pixels (required for 'raw_bgr')
 
         Returns:
             ExtractPolygonsResponse with extracted polygons
@@ -131,14 +959,40 @@ class PlotExtractionClient:
         if not self.stub:
             raise RuntimeError("Client not connected. Call connect() first.")
 
-        # Decode image
-        img_array = np.frombuffer(image_data, dtype=np.uint8)
-        image = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+        return self._extract_data(
+            image_data, entity_id, floor_id, image_format, config, width, height
+        )
+
+    def _extract_data(
+        self,
+        image_data: bytes,
+        entity_id: str,
+        floor_id: str,
+        image_format: str = "png",
+        config: Optional[task_pb2.PlotExtractionConfig] = None,
+        width: int = 0,
+        height: int = 0,
+    ) -> task_pb2.ExtractPolygonsResponse:
+        """
+        Extract polygons from floor plan image data, without requiring a
+        connection.
+
+        See extract_polygons.
+        """
+        original_size = None
+        if image_format == RAW_BGR_FORMAT:
+            image = _raw_bgr_image(image_data, width, height)
+        else:
+            image, original_size = _decode_image_for_extraction(
+                image_data, self.max_dimension
+            )
         if image is None:
             raise ValueError("Failed to decode image data")
 
         # Perform extraction
-        response = self._perform_local_extraction(image, entity_id, floor_id, config)
+        response = self._perform_local_extraction(
+            image, entity_id, floor_id, config, original_size
+        )
         return response
 
     def batch_extract(
@@ -146,14 +1000,26 @@ class PlotExtractionClient:
         floor_plans: list[tuple[str, str]],  # [(floor_id, image_path)]
         entity_id: str,
         config: Optional[task_pb2.PlotExtractionConfig] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
     ) -> task_pb2.BatchExtractResponse:
         """
         Extract polygons from multiple floor plans in batch.
 
+        Floors are processed on a thread pool; OpenCV releases the GIL while
+        decoding and processing, so floors overlap across cores. When
+        nvImageCodec is available the whole batch is decoded on the GPU up
+        front. With ``use_processes`` floors run on a shared process pool
+        instead, which also parallelizes the Python parts of the pipeline.
+        Results keep the order of ``floor_plans``.
+
         Args:
             floor_plans: List of (floor_id, image_path) tuples
             entity_id: Entity identifier
             config: Optional extraction configuration
+            max_workers: Worker threads (default: one per CPU, capped at the
+                number of floors); ignored with ``use_processes``
+            use_processes: Extract on worker processes instead of threads
 
         Returns:
             BatchExtractResponse with results for each floor
@@ -161,42 +1027,120 @@ class PlotExtractionClient:
         if not self.stub:
             raise RuntimeError("Client not connected. Call connect() first.")
 
-        extractions = []
-        successful = 0
-        failed = 0
-
-        for floor_id, image_path in floor_plans:
-            try:
-                response = self.extract_polygons_from_file(
-                    image_path, entity_id, floor_id, config
+        # Every floor shares one resolved config
+        cfg = self._get_config_with_defaults(config)
+
+        if use_processes and floor_plans:
+            # Only paths, params and serialized results cross the process
+            # boundary
+            futures = [
+                _get_process_pool().submit(
+                    _extract_floor_in_process,
+                    image_path,
+                    entity_id,
+                    floor_id,
+                    cfg,
+                    self.max_dimension,
                 )
+                for floor_id, image_path in floor_plans
+            ]
+            extractions = [
+                self._FloorExtraction.FromString(future.result()) for future in futures
+            ]
+        else:
+            extractions = self._extract_floors_threaded(
+                floor_plans, entity_id, cfg, max_workers
+            )
 
-                extraction = task_pb2.FloorExtraction(
-                    floor_id=floor_id,
-                    polygons=response.polygons,
-                    error=response.error,
-                    stats=response.stats,
-                )
-                extractions.append(extraction)
+        failed = sum(1 for extraction in extractions if extraction.error)
+
+        return task_pb2.BatchExtractResponse(
+            extractions=extractions,
+            successful=len(extractions) - failed,
+            failed=failed,
+        )
 
-                if response.error:
-                    failed += 1
-                else:
-                    successful += 1
+    def _extract_floors_threaded(
+        self,
+        floor_plans: list[tuple[str, str]],
+        entity_id: str,
+        cfg: ExtractionParams,
+        max_workers: Optional[int],
+    ) -> list[task_pb2.FloorExtraction]:
+        """
+        Extract a batch of floors on a thread pool.
 
-            except Exception as e:
-                logger.error(f"Failed to extract floor {floor_id}: {e}")
-                extraction = task_pb2.FloorExtraction(
+        Args:
+            floor_plans: List of (floor_id, image_path) tuples
+            entity_id: Entity identifier
+            cfg: Extraction params
+            max_workers: Worker threads (default: one per CPU, capped at the
+                number of floors)
+
+        Returns:
+            FloorExtraction for each floor, in order
+        """
+        if max_workers is None:
+            max_workers = min(len(floor_plans), os.cpu_count() or 1)
+
+        images = _decode_files_gpu([image_path for _, image_path in floor_plans])
+
+        def extract(
+            floor_plan: tuple[str, str], image: Optional[np.ndarray]
+        ) -> task_pb2.FloorExtraction:
+            floor_id, image_path = floor_plan
+            return self._extract_floor(image_path, entity_id, floor_id, cfg, image)
+
+        if max_workers <= 1:
+            return list(map(extract, floor_plans, images))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(extract, floor_plans, images))
+
+    def _extract_floor(
+        self,
+        image_path: str,
+        entity_id: str,
+        floor_id: str,
+        config: ExtractionParams,
+        image: Optional[np.ndarray] = None,
+    ) -> task_pb2.FloorExtraction:
+        """
+        Extract one floor of a batch, turning failures into an error entry.
+
+        Builds the FloorExtraction directly instead of going through an
+        intermediate ExtractPolygonsResponse.
+
+        Args:
+            image_path: Path to the floor plan image
+            entity_id: Entity identifier
+            floor_id: Floor identifier
+            config: Extraction params
+            image: Already decoded image; read from ``image_path`` if None
+
+        Returns:
+            FloorExtraction for the floor
+        """
+        original_size = None
+        if image is None:
+            try:
+                stat = os.stat(image_path)
+                _, image, original_size = _load_image_file(
+                    image_path, stat.st_mtime_ns, stat.st_size, self.max_dimension
+                )
+            except (OSError, ValueError) as e:
+                logger.error("Failed to extract floor %s: %s", floor_id, e)
+                return self._FloorExtraction(
                     floor_id=floor_id,
                     polygons=[],
                     error=str(e),
-                    stats=task_pb2.PlotProcessingStats(),
+                    stats=self._EMPTY_STATS,
                 )
-                extractions.append(extraction)
-                failed += 1
 
-        return task_pb2.BatchExtractResponse(
-            extractions=extractions, successful=successful, failed=failed
+        polygons, stats, error = self._extract_one(
+            image, entity_id, floor_id, config, original_size
+        )
+        return self._FloorExtraction(
+            floor_id=floor_id, polygons=polygons, error=error, stats=stats
         )
 
     def _perform_local_extraction(
@@ -205,6 +1149,7 @@ class PlotExtractionClient:
         entity_id: str,
         floor_id: str,
         config: Optional[task_pb2.PlotExtractionConfig] = None,
+        original_size: Optional[tuple[int, int]] = None,
     ) -> task_pb2.ExtractPolygonsResponse:
         """
         Perform polygon extraction using local OpenCV implementation.
@@ -217,44 +1162,77 @@ class PlotExtractionClient:
             entity_id: Entity identifier
             floor_id: Floor identifier
             config: Extraction configuration
+            original_size: Original (width, height) if ``image`` was decoded
+                at reduced size
 
         Returns:
             ExtractPolygonsResponse with extracted polygons
         """
-        start_time = time.time()
+        polygons, stats, error = self._extract_one(
+            image,
+            entity_id,
+            floor_id,
+            self._get_config_with_defaults(config),
+            original_size,
+        )
+        return self._Response(
+            polygons=polygons, total_count=len(polygons), error=error, stats=stats
+        )
 
-        try:
-            # Get config with defaults
-            cfg = self._get_config_with_defaults(config)
+    def _extract_one(
+        self,
+        image: np.ndarray,
+        entity_id: str,
+        floor_id: str,
+        config: ExtractionParams,
+        original_size: Optional[tuple[int, int]] = None,
+    ) -> tuple[list[task_pb2.Polygon], task_pb2.PlotProcessingStats, str]:
+        """
+        Extract polygons from one image, turning failures into an error string.
 
-            # Extract polygons using OpenCV
-            polygons, stats = self._extract_polygons_opencv(image, cfg)
+        Shared by the single-image and batch paths so neither has to build
+        intermediate response messages.
 
-            # Calculate processing time
-            processing_time = (time.time() - start_time) * 1000
-            stats.processing_time_ms = processing_time
+        Args:
+            image: OpenCV image (numpy array)
+            entity_id: Entity identifier
+            floor_id: Floor identifier
+            config: Extraction params
+            original_size: Original (width, height) if ``image`` was decoded
+                at reduced size
 
-            logger.info(
-                f"Extracted {len(polygons)} polygons for {entity_id}/{floor_id} "
-                f"in {processing_time:.2f}ms"
-            )
+        Returns:
+            Tuple of (polygons, processing stats, error message or "")
+        """
+        # Monotonic and high resolution, unlike time.time()
+        start_ns = time.perf_counter_ns()
 
-            return task_pb2.ExtractPolygonsResponse(
-                polygons=polygons, total_count=len(polygons), error="", stats=stats
+        try:
+            # Extract polygons using OpenCV
+            polygons, stats = self._extract_polygons_opencv(
+                image, config, original_size
             )
-
         except Exception as e:
-            logger.error(f"Extraction failed: {e}", exc_info=True)
-            return task_pb2.ExtractPolygonsResponse(
-                polygons=[],
-                total_count=0,
-                error=str(e),
-                stats=task_pb2.PlotProcessingStats(),
-            )
+            logger.error("Extraction failed: %s", e, exc_info=True)
+            return [], self._EMPTY_STATS, str(e)
+
+        # Calculate processing time
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e6
+        stats.processing_time_ms = processing_time
+
+        logger.info(
+            "Extracted %d polygons for %s/%s in %.2fms",
+            len(polygons),
+            entity_id,
+            floor_id,
+            processing_time,
+        )
+
+        return polygons, stats, ""
 
     def _get_config_with_defaults(
         self, config: Optional[task_pb2.PlotExtractionConfig]
-    ) -> task_pb2.PlotExtractionConfig:
+    ) -> ExtractionParams:
         """
         Get configuration with defaults applied.
 
@@ -262,80 +1240,183 @@ class PlotExtractionClient:
             config: User-provided configuration (may be None)
 
         Returns:
-            Configuration with defaults
+            Extraction params with defaults
         """
-        if config is None:
-            config = task_pb2.PlotExtractionConfig()
-
-        # Apply defaults for zero values
-        default_config = task_pb2.PlotExtractionConfig(
-            blur_kernel_size=config.blur_kernel_size
-            if config.blur_kernel_size > 0
-            else 5.0,
-            threshold_value=config.threshold_value
-            if config.threshold_value > 0
-            else 127,
-            threshold_type=config.threshold_type,
-            min_area=config.min_area if config.min_area > 0 else 100.0,
-            max_area=config.max_area,
-            epsilon_factor=config.epsilon_factor if config.epsilon_factor > 0 else 0.01,
-            apply_morphology=config.apply_morphology
-            if config.HasField("apply_morphology")
-            else True,
-            morph_kernel_size=config.morph_kernel_size
-            if config.morph_kernel_size > 0
-            else 5,
-            use_canny=config.use_canny,
-            canny_low=config.canny_low if config.canny_low > 0 else 50,
-            canny_high=config.canny_high if config.canny_high > 0 else 150,
-        )
+        params = ExtractionParams.from_proto(config)
+        if self.downscale > 1.0:
+            params = dataclasses.replace(params, downscale=self.downscale)
+        return params
+
+    def _scratch_buffers(
+        self, height: int, width: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get two uint8 scratch images owned by the calling thread.
 
-        return default_config
+        The backing buffers only grow, so a batch of similarly sized floor
+        plans settles on one allocation per worker thread.
+
+        Args:
+            height: Image height in pixels
+            width: Image width in pixels
+
+        Returns:
+            Two contiguous height x width views over this thread's buffers
+        """
+        size = height * width
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None or buffers[0].size < size:
+            buffers = (np.empty(size, np.uint8), np.empty(size, np.uint8))
+            self._scratch.buffers = buffers
+        return tuple(buf[:size].reshape(height, width) for buf in buffers)
 
     def _extract_polygons_opencv(
-        self, image: np.ndarray, config: task_pb2.PlotExtractionConfig
+        self,
+        image: np.ndarray,
+        config: ExtractionParams,
+        original_size: Optional[tuple[int, int]] = None,
     ) -> tuple[list[task_pb2.Polygon], task_pb2.PlotProcessingStats]:
         """
         Extract polygons from image using OpenCV.
 
-        TODO: This is a placeholder implementation. The user will implement
-        the actual computer vision algorithm using OpenCV.
-
-        The algorithm should:
-        1. Preprocess image (grayscale, blur, threshold)
-        2. Apply morphological operations if enabled
-        3. Detect edges (Canny if enabled)
-        4. Find contours
-        5. Approximate contours to polygons
+        The algorithm:
+        1. Preprocess image (downscale oversized images, grayscale, blur)
+        2. Binarize with a fixed or Otsu threshold, or Canny edges if enabled
+        3. Apply morphological closing if enabled
+        4. Find external contours
+        5. Calculate areas and centroids for all contours at once
         6. Filter by area
-        7. Calculate centroids and areas
+        7. Approximate the kept contours to polygons
         8. Convert to protobuf format
 
         Args:
-            image: OpenCV image
+            image: OpenCV image (BGR or grayscale); 16-bit and float images
+                are converted to 8 bits first
             config: Extraction configuration
+            original_size: Original (width, height) if ``image`` was decoded
+                at reduced size; results are reported in original pixels
 
         Returns:
             Tuple of (polygons, processing stats)
         """
+        # Every stage runs on 8-bit pixels: Canny and Otsu require it, and
+        # wider types multiply the memory traffic of each pass
+        if image.dtype != np.uint8:
+            image = cv2.convertScaleAbs(image, alpha=_UINT8_SCALE.get(image.dtype, 1.0))
+
         height, width = image.shape[:2]
+        scale = 1.0
+        if original_size is not None:
+            width, height = original_size
+            scale = image.shape[1] / width
+
+        # Polygon structure survives downsampling, and every later stage
+        # scales with pixel count; coordinates are scaled back at the end. An
+        # explicit downscale factor wins over the client's max_dimension
+        target_scale = scale
+        if config.downscale > 1.0:
+            target_scale = 1.0 / config.downscale
+        elif self.max_dimension and max(height, width) > self.max_dimension:
+            target_scale = self.max_dimension / max(height, width)
+        if target_scale < scale:
+            scale = target_scale
+            image = cv2.resize(
+                image,
+                (max(1, round(width * scale)), max(1, round(height * scale))),
+                interpolation=cv2.INTER_AREA,
+            )
 
-        stats = task_pb2.PlotProcessingStats(
-            contours_found=0,
-            contours_filtered=0,
-            image_width=width,
-            image_height=height,
+        is_gray = image.ndim == 2
+
+        # The per-pixel stages run through OpenCV's T-API on an OpenCL device
+        # when requested and available; contour tracing stays on the CPU
+        use_opencl = self.use_opencl and cv2.ocl.haveOpenCL()
+        if use_opencl:
+            image = cv2.UMat(image)
+
+        # Every stage writes into this thread's scratch images instead of
+        # allocating a fresh full-frame array per step; the T-API path keeps
+        # its buffers on the device
+        if use_opencl:
+            scratch_a = scratch_b = None
+        else:
+            scratch_a, scratch_b = self._scratch_buffers(*image.shape[:2])
+
+        if is_gray:
+            gray = image
+        else:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=scratch_a)
+
+        # Gaussian kernels must be odd
+        blur_size = int(config.blur_kernel_size) | 1
+        blurred = cv2.GaussianBlur(gray, (blur_size, blur_size), 0, dst=scratch_b)
+
+        # gray is dead from here on, so the binary image reuses its buffer
+        if config.use_canny:
+            binary = cv2.Canny(
+                blurred, config.canny_low, config.canny_high, edges=scratch_a
+            )
+        elif config.threshold_type == 1:
+            _, binary = cv2.threshold(
+                blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=scratch_a
+            )
+        else:
+            _, binary = cv2.threshold(
+                blurred, config.threshold_value, 255, cv2.THRESH_BINARY, dst=scratch_a
+            )
+
+        if config.apply_morphology and config.morph_kernel_size > 0:
+            kernel = _struct_elem(config.morph_kernel_size)
+            binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel, dst=scratch_b)
+
+        if use_opencl:
+            binary = binary.get()
+
+        # CHAIN_APPROX_SIMPLE rather than TC89_KCOS: the Teh-Chin pass halves
+        # the point count but costs more than it saves in the area and
+        # approxPolyDP stages that follow
+        contours, _ = cv2.findContours(
+            binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
 
-        # TODO: Implement actual polygon extraction algorithm
-        # This is a placeholder that returns empty results
+        areas, centroid_xs, centroid_ys = _contour_areas_centroids(contours)
+        inverse_scale = 1.0 / scale
+        if scale != 1.0:
+            areas *= inverse_scale * inverse_scale
+            centroid_xs *= inverse_scale
+            centroid_ys *= inverse_scale
+        keep = areas >= config.min_area
+        if config.max_area > 0:
+            keep &= areas <= config.max_area
 
         polygons = []
-
-        logger.warning(
-            "Polygon extraction algorithm not yet implemented. "
-            "This is a placeholder. Implement _extract_polygons_opencv() "
-            "with OpenCV contour detection and polygon approximation."
+        for i in np.flatnonzero(keep).tolist():
+            contour = contours[i]
+            epsilon = config.epsilon_factor * cv2.arcLength(contour, True)
+            approx = cv2.approxPolyDP(contour, epsilon, True)
+            coords = approx.reshape(-1, 2)
+            if scale != 1.0:
+                coords = coords * inverse_scale
+
+            polygon = self._Polygon(area=float(areas[i]))
+            polygon.centroid.x = float(centroid_xs[i])
+            polygon.centroid.y = float(centroid_ys[i])
+            if self._wire_vertices:
+                # One parse in C instead of a Python add() per vertex
+                polygon.MergeFromString(_encode_vertices(coords))
+            else:
+                # Build vertices in place; constructing Point objects and
+                # handing them over copies every vertex a second time
+                add_vertex = polygon.vertices.add
+                for x, y in coords.tolist():
+                    add_vertex(x=x, y=y)
+            polygons.append(polygon)
+
+        stats = self._Stats(
+            contours_found=len(contours),
+            contours_filtered=len(contours) - len(polygons),
+            image_width=width,
+            image_height=height,
         )
 
         return polygons, stats
@@ -350,6 +1431,221 @@ class PlotExtractionClient:
         self.close()
 
 
+def _extract_floor_in_process(
+    image_path: str,
+    entity_id: str,
+    floor_id: str,
+    config: ExtractionParams,
+    max_dimension: Optional[int],
+) -> bytes:
+    """
+    Extract one floor on a worker process.
+
+    Args:
+        image_path: Path to the floor plan image
+        entity_id: Entity identifier
+        floor_id: Floor identifier
+        config: Extraction params
+        max_dimension: See PlotExtractionClient
+
+    Returns:
+        Serialized FloorExtraction
+    """
+    client = PlotExtractionClient(max_dimension=max_dimension)
+    extraction = client._extract_floor(image_path, entity_id, floor_id, config)
+    return extraction.SerializeToString()
+
+
+class AsyncPlotExtractionClient:
+    """
+    Asynchronous wrapper around PlotExtractionClient's local extraction.
+
+    Extraction work runs on a dedicated pool of worker threads, one per CPU,
+    so floors issued concurrently (e.g. by ``batch_extract``) overlap instead
+    of being processed one at a time, the event loop stays free, and long
+    extractions do not queue ahead of other work on the loop's default
+    executor. Nothing is sent to the orchestrator, so no channel is opened.
+    """
+
+    def __init__(self, orchestrator_address: str = "localhost:50051"):
+        """
+        Initialize the async plot extraction client.
+
+        Args:
+            orchestrator_address: Address of the orchestrator server (default: localhost:50051)
+        """
+        self.orchestrator_address = orchestrator_address
+        # Performs the local extraction; never opens a channel
+        self._local = PlotExtractionClient(orchestrator_address)
+        self._compute: Optional[ThreadPoolExecutor] = None
+
+    async def connect(self):
+        """Start the extraction thread pool."""
+        self._compute = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="plot-extract"
+        )
+
+    async def close(self):
+        """Stop the extraction thread pool."""
+        if self._compute:
+            self._compute.shutdown(wait=False)
+            self._compute = None
+
+    def _run(self, func, *args) -> asyncio.Future:
+        """
+        Run a blocking call on the compute pool.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for ``func``
+
+        Returns:
+            Future resolving to the call's result
+
+        Raises:
+            RuntimeError: If connect() has not been called
+        """
+        if not self._compute:
+            raise RuntimeError("Client not connected. Call connect() first.")
+        return asyncio.get_running_loop().run_in_executor(self._compute, func, *args)
+
+    async def extract_polygons_from_file(
+        self,
+        image_path: str,
+        entity_id: str,
+        floor_id: str,
+        config: Optional[task_pb2.PlotExtractionConfig] = None,
+    ) -> task_pb2.ExtractPolygonsResponse:
+        """
+        Extract polygons from a floor plan image file.
+
+        See PlotExtractionClient.extract_polygons_from_file.
+        """
+        return await self._run(
+            self._local._extract_file,
+            image_path,
+            entity_id,
+            floor_id,
+            config,
+        )
+
+    async def extract_polygons(
+        self,
+        image_data: bytes,
+        entity_id: str,
+        floor_id: str,
+        image_format: str = "png",
+        config: Optional[task_pb2.PlotExtractionConfig] = None,
+        width: int = 0,
+        height: int = 0,
+    ) -> task_pb2.ExtractPolygonsResponse:
+        """
+        Extract polygons from floor plan image data.
+
+        See PlotExtractionClient.extract_polygons.
+        """
+        return await self._run(
+            self._local._extract_data,
+            image_data,
+            entity_id,
+            floor_id,
+            image_format,
+            config,
+            width,
+            height,
+        )
+
+    async def batch_extract(
+        self,
+        floor_plans: list[tuple[str, str]],  # [(floor_id, image_path)]
+        entity_id: str,
+        config: Optional[task_pb2.PlotExtractionConfig] = None,
+    ) -> task_pb2.BatchExtractResponse:
+        """
+        Extract polygons from multiple floor plans concurrently.
+
+        Args:
+            floor_plans: List of (floor_id, image_path) tuples
+            entity_id: Entity identifier
+            config: Optional extraction configuration
+
+        Returns:
+            BatchExtractResponse with results in the order of ``floor_plans``
+        """
+        extractions = await asyncio.gather(
+            *await self._floor_extractions(floor_plans, entity_id, config)
+        )
+        failed = sum(1 for extraction in extractions if extraction.error)
+
+        return task_pb2.BatchExtractResponse(
+            extractions=list(extractions),
+            successful=len(extractions) - failed,
+            failed=failed,
+        )
+
+    async def stream_extract(
+        self,
+        floor_plans: list[tuple[str, str]],  # [(floor_id, image_path)]
+        entity_id: str,
+        config: Optional[task_pb2.PlotExtractionConfig] = None,
+    ) -> AsyncIterator[task_pb2.FloorExtraction]:
+        """
+        Extract polygons from multiple floor plans, yielding each result as
+        soon as its floor is done.
+
+        Results arrive in completion order, not input order; match them up by
+        ``floor_id``.
+
+        Args:
+            floor_plans: List of (floor_id, image_path) tuples
+            entity_id: Entity identifier
+            config: Optional extraction configuration
+
+        Yields:
+            FloorExtraction for each floor
+        """
+        pending = await self._floor_extractions(floor_plans, entity_id, config)
+        for extraction in asyncio.as_completed(pending):
+            yield await extraction
+
+    async def _floor_extractions(
+        self,
+        floor_plans: list[tuple[str, str]],
+        entity_id: str,
+        config: Optional[task_pb2.PlotExtractionConfig],
+    ) -> list[Awaitable[task_pb2.FloorExtraction]]:
+        """
+        Start one extraction per floor on the compute pool.
+
+        Args:
+            floor_plans: List of (floor_id, image_path) tuples
+            entity_id: Entity identifier
+            config: Optional extraction configuration
+
+        Returns:
+            Awaitable FloorExtraction for each floor, in order
+        """
+        cfg = self._local._get_config_with_defaults(config)
+        images = await self._run(
+            _decode_files_gpu, [image_path for _, image_path in floor_plans]
+        )
+        return [
+            self._run(
+                self._local._extract_floor, image_path, entity_id, floor_id, cfg, image
+            )
+            for (floor_id, image_path), image in zip(floor_plans, images)
+        ]
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
 def main():
     """Example usage of the PlotExtractionClient."""
     import sys
@@ -399,6 +1695,9 @@ def main():
                 if polygon.label:
                     print(f"  Label: {polygon.label}")
 
+    shutdown_process_pool()
+    shutdown_channels()
+
 
 if __name__ == "__main__":
     main()
@@ -8,17 +8,18 @@ Note: These tests mock the proto imports to avoid protobuf import issues.
 Run `just proto-plot` to generate proto files before running full integration tests.
 """
 
+import importlib.util
 import pytest
 import numpy as np
 import cv2
+import grpc
 from pathlib import Path
+import struct
 import sys
+import threading
 from unittest.mock import MagicMock
 from types import ModuleType
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 # Mock proto imports to avoid protobuf import issues
 proto_module = ModuleType("proto")
 sys.modules["proto"] = proto_module
@@ -43,6 +44,28 @@ class MockPlotExtractionConfig:
     def HasField(self, field):
         return hasattr(self, field) and getattr(self, field) is not None
 
+    def CopyFrom(self, other):
+        self.__dict__.update(other.__dict__)
+
+    def MergeFrom(self, other):
+        # Proto3 semantics: only non-zero scalars overwrite
+        self.__dict__.update({k: v for k, v in other.__dict__.items() if v})
+
+
+class MockOptionalMorphologyConfig(MockPlotExtractionConfig):
+    """Config whose apply_morphology is declared ``optional bool``"""
+
+    DESCRIPTOR = MagicMock(
+        fields_by_name={"apply_morphology": MagicMock(has_presence=True)}
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.set_fields = set(kwargs)
+
+    def HasField(self, field):
+        return field in self.set_fields
+
 
 class MockPoint:
     def __init__(self, x=0.0, y=0.0):
@@ -50,9 +73,16 @@ class MockPoint:
         self.y = y
 
 
+class MockRepeatedPoints(list):
+    def add(self, **kwargs):
+        point = MockPoint(**kwargs)
+        self.append(point)
+        return point
+
+
 class MockPolygon:
     def __init__(self, vertices=None, area=0.0, centroid=None, label=""):
-        self.vertices = vertices or []
+        self.vertices = MockRepeatedPoints(vertices or [])
         self.area = area
         self.centroid = centroid or MockPoint()
         self.label = label
@@ -71,6 +101,15 @@ class MockExtractPolygonsResponse:
     def __init__(self, **kwargs):
         self.polygons = kwargs.get("polygons", [])
         self.total_count = kwargs.get("total_count", 0)
+        self.error = kwargs.get("error", "")
+        self.stats = kwargs.get("stats", MockPlotProcessingStats())
+
+
+class MockFloorExtraction:
+    def __init__(self, **kwargs):
+        self.floor_id = kwargs.get("floor_id", "")
+        self.polygons = kwargs.get("polygons", [])
+        self.error = kwargs.get("error", "")
         self.stats = kwargs.get("stats", MockPlotProcessingStats())
 
 
@@ -88,7 +127,7 @@ task_pb2.Point = MockPoint
 task_pb2.Polygon = MockPolygon
 task_pb2.PlotProcessingStats = MockPlotProcessingStats
 task_pb2.ExtractPolygonsResponse = MockExtractPolygonsResponse
-task_pb2.FloorExtraction = lambda **kwargs: MagicMock(**kwargs)
+task_pb2.FloorExtraction = MockFloorExtraction
 task_pb2.BatchExtractResponse = MockBatchExtractResponse
 
 # Register module in sys.modules and as attribute of proto
@@ -96,7 +135,24 @@ sys.modules["proto.task_pb2"] = task_pb2
 proto_module.task_pb2 = task_pb2
 
 # Import after mocking  # noqa: E402
-from plot_client import PlotExtractionClient  # noqa: E402
+import plot_client  # noqa: E402
+from plot_client import AsyncPlotExtractionClient, PlotExtractionClient  # noqa: E402
+
+
+@pytest.fixture
+def generated_task_pb2(monkeypatch):
+    """Load the generated task_pb2 that the mocks above stand in for"""
+    pytest.importorskip("google.protobuf")
+    # task_pb2_grpc imports task_pb2 as a top-level module, and process-pool
+    # workers inherit sys.path when the pool starts
+    proto_dir = Path(plot_client.__file__).parent / "proto"
+    monkeypatch.syspath_prepend(str(proto_dir))
+    spec = importlib.util.spec_from_file_location(
+        "generated_task_pb2", proto_dir / "task_pb2.py"
+    )
+    generated = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generated)
+    return generated
 
 
 class TestPlotExtractionClient:
@@ -120,6 +176,73 @@ class TestPlotExtractionClient:
             # Connection would be established here in real scenario
             # For now, just verify the client object exists
 
+    def test_connect_reuses_shared_channel(self):
+        """Test clients for the same address share one channel"""
+        first = PlotExtractionClient("localhost:50099")
+        second = PlotExtractionClient("localhost:50099")
+        first.connect()
+        second.connect()
+
+        try:
+            assert first.channel is second.channel
+
+            # Closing one client must not close the channel under the other
+            first.close()
+            assert first.channel is None
+            assert second.channel is plot_client._get_channel(
+                "localhost:50099", (("grpc.channel_id", 0),)
+            )
+        finally:
+            second.close()
+            plot_client.shutdown_channels()
+
+        assert plot_client._CHANNEL_CACHE == {}
+
+    def test_connect_dedicated_channel(self):
+        """Test shared_channel=False opens a channel owned by the client"""
+        client = PlotExtractionClient("localhost:50099", shared_channel=False)
+        client.connect()
+
+        try:
+            assert client.channel is not plot_client._get_channel(
+                "localhost:50099", (("grpc.channel_id", 0),)
+            )
+        finally:
+            client.close()
+            plot_client.shutdown_channels()
+
+    def test_channel_pool_round_robin(self):
+        """Test the pool opens distinct channels and cycles through their stubs"""
+        pool = plot_client.ChannelPool("localhost:50099", MagicMock, size=3)
+
+        try:
+            assert len(set(map(id, pool.channels))) == 3
+            picked = [pool.next_stub() for _ in range(6)]
+            assert picked == pool.stubs * 2
+        finally:
+            pool.close()
+            plot_client.shutdown_channels()
+
+    def test_channels_keyed_by_compression(self):
+        """Test compressed and uncompressed channels are cached separately"""
+        try:
+            plain = plot_client._get_channel("localhost:50099")
+            gzip = plot_client._get_channel(
+                "localhost:50099", compression=grpc.Compression.Gzip
+            )
+
+            assert plain is not gzip
+            assert gzip is plot_client._get_channel(
+                "localhost:50099", compression=grpc.Compression.Gzip
+            )
+        finally:
+            plot_client.shutdown_channels()
+
+    def test_channel_pool_rejects_empty(self):
+        """Test a pool needs at least one channel"""
+        with pytest.raises(ValueError):
+            plot_client.ChannelPool("localhost:50099", MagicMock, size=0)
+
     def test_config_with_defaults_none(self):
         """Test _get_config_with_defaults with None config"""
         client = PlotExtractionClient()
@@ -146,25 +269,349 @@ class TestPlotExtractionClient:
         assert config.threshold_value == 100  # Custom value
         assert config.min_area == 200.0  # Custom value
         assert config.epsilon_factor == 0.01  # Default value
+        assert config.apply_morphology is True  # Default value
+        assert config.canny_high == 150  # Default value
+
+    def test_config_with_defaults_morphology_without_presence(self):
+        """Test False keeps morphology on when unset and False look the same"""
+        client = PlotExtractionClient()
+
+        config = client._get_config_with_defaults(
+            MockPlotExtractionConfig(apply_morphology=False, min_area=50.0)
+        )
+
+        assert config.apply_morphology is True
+        assert config.min_area == 50.0
+
+    def test_config_with_defaults_morphology_off(self):
+        """Test an explicit False turns morphology off when presence is tracked"""
+        client = PlotExtractionClient()
+
+        config = client._get_config_with_defaults(
+            MockOptionalMorphologyConfig(apply_morphology=False, min_area=50.0)
+        )
+
+        assert config.apply_morphology is False
+        assert config.min_area == 50.0
+
+    def test_config_with_defaults_morphology_unset_with_presence(self):
+        """Test an unset optional apply_morphology keeps morphology on"""
+        client = PlotExtractionClient()
+
+        config = client._get_config_with_defaults(
+            MockOptionalMorphologyConfig(min_area=50.0)
+        )
+
+        assert config.apply_morphology is True
+
+    def test_config_with_defaults_morphology_on(self):
+        """Test apply_morphology=True keeps morphology on"""
+        client = PlotExtractionClient()
+
+        config = client._get_config_with_defaults(
+            MockPlotExtractionConfig(apply_morphology=True)
+        )
+
+        assert config.apply_morphology is True
+
+    @pytest.mark.parametrize(
+        "field, default",
+        [
+            ("blur_kernel_size", 5.0),
+            ("min_area", 100.0),
+            ("epsilon_factor", 0.01),
+            ("morph_kernel_size", 5),
+            ("canny_low", 50),
+            ("canny_high", 150),
+        ],
+    )
+    def test_config_with_defaults_negative_uses_default(self, field, default):
+        """Test a negative numeric field falls back to its default"""
+        client = PlotExtractionClient()
+
+        config = client._get_config_with_defaults(
+            MockPlotExtractionConfig(**{field: -3})
+        )
+
+        assert getattr(config, field) == default
+
+    def test_config_with_defaults_plain_fields(self):
+        """Test use_canny and threshold_type are used as given"""
+        client = PlotExtractionClient()
+
+        config = client._get_config_with_defaults(
+            MockPlotExtractionConfig(use_canny=True, threshold_type=1)
+        )
+
+        assert config.use_canny is True
+        assert config.threshold_type == 1
+
+    def test_config_with_defaults_none_is_shared(self):
+        """Test the no-config path reuses the prebuilt defaults"""
+        client = PlotExtractionClient()
+
+        assert client._get_config_with_defaults(
+            None
+        ) is client._get_config_with_defaults(None)
 
-    def test_extract_polygons_opencv_placeholder(self):
-        """Test _extract_polygons_opencv returns empty results (placeholder)"""
+    def test_config_with_defaults_empty_is_shared(self):
+        """Test a config with nothing set resolves to the shared defaults"""
+        client = PlotExtractionClient()
+
+        assert client._get_config_with_defaults(
+            MockPlotExtractionConfig()
+        ) is client._get_config_with_defaults(None)
+
+    def test_config_with_defaults_does_not_mutate_defaults(self):
+        """Test merging a user config leaves the shared defaults intact"""
+        client = PlotExtractionClient()
+
+        client._get_config_with_defaults(MockPlotExtractionConfig(min_area=1.0))
+
+        assert client._get_config_with_defaults(None).min_area == 100.0
+
+    def test_extract_polygons_opencv_rectangle(self):
+        """Test _extract_polygons_opencv finds a filled rectangle"""
         client = PlotExtractionClient()
 
         # Create a simple test image (white rectangle on black background)
         image = np.zeros((500, 500, 3), dtype=np.uint8)
         cv2.rectangle(image, (100, 100), (400, 400), (255, 255, 255), -1)
 
-        config = MockPlotExtractionConfig()
+        config = client._get_config_with_defaults(None)
 
         polygons, stats = client._extract_polygons_opencv(image, config)
 
-        # Placeholder implementation returns empty results
-        assert len(polygons) == 0
-        assert stats.contours_found == 0
+        assert len(polygons) == 1
+        assert len(polygons[0].vertices) == 4
+        assert polygons[0].area == pytest.approx(300 * 300, rel=0.02)
+        assert polygons[0].centroid.x == pytest.approx(250, abs=1)
+        assert polygons[0].centroid.y == pytest.approx(250, abs=1)
+        assert stats.contours_found == 1
+        assert stats.contours_filtered == 0
         assert stats.image_width == 500
         assert stats.image_height == 500
 
+    def test_encode_vertices_wire_format(self):
+        """Test vertices encode as length-delimited Points with double x/y"""
+        coords = np.array([[1, 2], [300, 4000]], dtype=np.int32)
+
+        wire = plot_client._encode_vertices(coords)
+
+        assert len(wire) == 2 * 20
+        assert struct.unpack("<BBBdBd", wire[20:]) == (
+            0x0A,
+            18,
+            0x09,
+            300.0,
+            0x11,
+            4000.0,
+        )
+
+    def test_mock_polygon_has_no_wire_vertices(self):
+        """Test message classes without a descriptor use vertices.add()"""
+        assert not plot_client._has_point_vertices(MockPolygon)
+
+    @pytest.mark.parametrize("wire_vertices", [True, False])
+    def test_perform_local_extraction_generated_messages(
+        self, monkeypatch, generated_task_pb2, wire_vertices
+    ):
+        """Test vertices land in the real task_pb2 messages on both paths"""
+        generated = generated_task_pb2
+        # The encoder's layout must match the real Polygon for the wire path
+        assert plot_client._has_point_vertices(generated.Polygon)
+        monkeypatch.setattr(
+            PlotExtractionClient, "_Response", generated.ExtractPolygonsResponse
+        )
+        monkeypatch.setattr(
+            PlotExtractionClient, "_Stats", generated.PlotProcessingStats
+        )
+        monkeypatch.setattr(PlotExtractionClient, "_Polygon", generated.Polygon)
+        monkeypatch.setattr(PlotExtractionClient, "_wire_vertices", wire_vertices)
+        client = PlotExtractionClient()
+        image = np.zeros((500, 500, 3), dtype=np.uint8)
+        cv2.rectangle(image, (100, 100), (400, 400), (255, 255, 255), -1)
+
+        response = client._perform_local_extraction(image, "test-entity", "1")
+
+        # A serialize/parse round trip checks the merged bytes are well formed
+        response = generated.ExtractPolygonsResponse.FromString(
+            response.SerializeToString()
+        )
+        assert response.total_count == 1
+        # Corners come back within a pixel of the drawn ones
+        vertices = response.polygons[0].vertices
+        assert sorted((round(v.x, -2), round(v.y, -2)) for v in vertices) == [
+            (100, 100),
+            (100, 400),
+            (400, 100),
+            (400, 400),
+        ]
+
+    @pytest.mark.parametrize(
+        "dtype, white", [(np.uint16, 65535), (np.float32, 1.0), (np.float64, 1.0)]
+    )
+    def test_extract_polygons_opencv_converts_to_uint8(self, dtype, white):
+        """Test deeper pixel types give the same result as 8-bit input"""
+        client = PlotExtractionClient()
+        config = client._get_config_with_defaults(None)
+        image = np.zeros((200, 200), dtype=np.uint8)
+        cv2.rectangle(image, (50, 50), (150, 150), 255, -1)
+        deep = (image / 255 * white).astype(dtype)
+
+        expected, _ = client._extract_polygons_opencv(image, config)
+        polygons, _ = client._extract_polygons_opencv(deep, config)
+
+        assert len(polygons) == len(expected) == 1
+        assert polygons[0].area == expected[0].area
+
+    def test_extract_polygons_opencv_reuses_scratch_buffers(self):
+        """Test repeated extractions share per-thread buffers and agree"""
+        client = PlotExtractionClient()
+        config = client._get_config_with_defaults(None)
+        large = np.zeros((300, 300, 3), dtype=np.uint8)
+        cv2.rectangle(large, (50, 50), (250, 250), (255, 255, 255), -1)
+        small = np.ascontiguousarray(large[:200, :150])
+
+        first, _ = client._extract_polygons_opencv(large, config)
+        buffers = client._scratch.buffers
+        client._extract_polygons_opencv(small, config)
+        second, _ = client._extract_polygons_opencv(large, config)
+
+        assert client._scratch.buffers is buffers
+        assert [p.area for p in second] == [p.area for p in first]
+
+    def test_extract_polygons_opencv_filters_by_area(self):
+        """Test contours outside [min_area, max_area] are filtered out"""
+        client = PlotExtractionClient()
+
+        image = np.zeros((300, 300), dtype=np.uint8)
+        cv2.rectangle(image, (10, 10), (20, 20), 255, -1)  # ~100 px
+        cv2.rectangle(image, (50, 50), (150, 150), 255, -1)  # ~10000 px
+        cv2.rectangle(image, (160, 10), (290, 290), 255, -1)  # ~36400 px
+
+        config = plot_client.ExtractionParams(
+            blur_kernel_size=1.0,
+            threshold_value=127,
+            min_area=500.0,
+            max_area=20000.0,
+            epsilon_factor=0.01,
+            apply_morphology=False,
+        )
+
+        polygons, stats = client._extract_polygons_opencv(image, config)
+
+        assert len(polygons) == 1
+        assert polygons[0].area == pytest.approx(100 * 100, rel=0.01)
+        assert stats.contours_found == 3
+        assert stats.contours_filtered == 2
+
+    def test_extract_polygons_opencv_umat_matches_cpu(self, monkeypatch):
+        """Test the T-API (UMat) path gives the same polygons as the CPU path"""
+        image = np.zeros((300, 300, 3), dtype=np.uint8)
+        cv2.rectangle(image, (30, 40), (200, 260), (255, 255, 255), -1)
+        cv2.circle(image, (250, 60), 30, (255, 255, 255), -1)
+
+        cpu_client = PlotExtractionClient()
+        config = cpu_client._get_config_with_defaults(None)
+        cpu_polygons, _ = cpu_client._extract_polygons_opencv(image, config)
+
+        # UMat falls back to CPU kernels without a device, so force the path
+        monkeypatch.setattr(cv2.ocl, "haveOpenCL", lambda: True)
+        umat_client = PlotExtractionClient(use_opencl=True)
+        umat_polygons, _ = umat_client._extract_polygons_opencv(image, config)
+
+        assert len(umat_polygons) == len(cpu_polygons) == 2
+        for umat_polygon, cpu_polygon in zip(umat_polygons, cpu_polygons):
+            assert umat_polygon.area == cpu_polygon.area
+
+    def test_extract_polygons_opencv_downscales_large_images(self):
+        """Test oversized images are downscaled and results scaled back"""
+        image = np.zeros((1000, 4000), dtype=np.uint8)
+        cv2.rectangle(image, (400, 200), (2400, 800), 255, -1)
+        config = PlotExtractionClient()._get_config_with_defaults(None)
+
+        client = PlotExtractionClient(max_dimension=1000)
+        polygons, stats = client._extract_polygons_opencv(image, config)
+
+        assert len(polygons) == 1
+        assert polygons[0].area == pytest.approx(2000 * 600, rel=0.02)
+        assert polygons[0].centroid.x == pytest.approx(1400, abs=5)
+        assert polygons[0].centroid.y == pytest.approx(500, abs=5)
+        xs = [v.x for v in polygons[0].vertices]
+        assert min(xs) == pytest.approx(400, abs=5)
+        assert max(xs) == pytest.approx(2400, abs=5)
+        assert (stats.image_width, stats.image_height) == (4000, 1000)
+
+    def test_extract_polygons_reduced_jpeg_decode(self, monkeypatch):
+        """Test large JPEGs are decoded at reduced size and reported full size"""
+        image = np.zeros((1000, 4000, 3), dtype=np.uint8)
+        cv2.rectangle(image, (400, 200), (2400, 800), (255, 255, 255), -1)
+        success, encoded = cv2.imencode(".jpg", image)
+        assert success
+        decode = MagicMock(wraps=plot_client._decode_image)
+        monkeypatch.setattr(plot_client, "_decode_image", decode)
+
+        client = PlotExtractionClient(max_dimension=1000)
+        client.stub = MagicMock()
+        response = client.extract_polygons(encoded.tobytes(), "test-entity", "1")
+
+        # 4000 / 4 still covers max_dimension, 4000 / 8 would not
+        assert decode.call_args.args[1] == 4
+        assert response.total_count == 1
+        assert response.polygons[0].area == pytest.approx(2000 * 600, rel=0.02)
+        assert response.polygons[0].centroid.x == pytest.approx(1400, abs=5)
+        assert response.polygons[0].centroid.y == pytest.approx(500, abs=5)
+        assert (response.stats.image_width, response.stats.image_height) == (
+            4000,
+            1000,
+        )
+
+    def test_extract_polygons_opencv_downscale_factor(self, monkeypatch):
+        """Test an explicit downscale factor applies below max_dimension"""
+        image = np.zeros((1000, 1000), dtype=np.uint8)
+        cv2.rectangle(image, (200, 300), (600, 700), 255, -1)
+        config = plot_client.ExtractionParams(downscale=4.0)
+        client = PlotExtractionClient()
+        resize = MagicMock(wraps=cv2.resize)
+        monkeypatch.setattr(plot_client.cv2, "resize", resize)
+
+        polygons, stats = client._extract_polygons_opencv(image, config)
+
+        assert resize.call_args.args[1] == (250, 250)
+        assert len(polygons) == 1
+        assert polygons[0].area == pytest.approx(400 * 400, rel=0.03)
+        assert polygons[0].centroid.x == pytest.approx(400, abs=5)
+        assert (stats.image_width, stats.image_height) == (1000, 1000)
+
+    def test_client_downscale_option(self):
+        """Test the client-wide downscale reaches the params"""
+        client = PlotExtractionClient(downscale=4.0)
+
+        assert client._get_config_with_defaults(None).downscale == 4.0
+        assert client._get_config_with_defaults(
+            MockPlotExtractionConfig(min_area=10.0)
+        ).downscale == 4.0
+
+        assert PlotExtractionClient()._get_config_with_defaults(None).downscale == 0.0
+
+    def test_extract_polygons_client_downscale(self, monkeypatch):
+        """Test the client-wide downscale applies through the public API"""
+        image = np.zeros((1000, 1000, 3), dtype=np.uint8)
+        cv2.rectangle(image, (200, 300), (600, 700), (255, 255, 255), -1)
+        client = PlotExtractionClient(downscale=4.0)
+        client.stub = MagicMock()
+        resize = MagicMock(wraps=cv2.resize)
+        monkeypatch.setattr(plot_client.cv2, "resize", resize)
+
+        response = client.extract_polygons(
+            image.tobytes(), "entity-1", "floor-1", "raw_bgr", width=1000, height=1000
+        )
+
+        assert resize.call_args.args[1] == (250, 250)
+        assert response.total_count == 1
+        assert response.polygons[0].area == pytest.approx(400 * 400, rel=0.03)
+
     def test_perform_local_extraction_handles_errors(self):
         """Test _perform_local_extraction error handling"""
         client = PlotExtractionClient()
@@ -205,6 +652,43 @@ class TestPlotExtractionClient:
         assert response is not None
         assert response.total_count >= 0
 
+    def test_extract_polygons_raw_bgr(self):
+        """Test raw BGR pixels skip decoding and match the encoded path"""
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        cv2.rectangle(image, (25, 25), (75, 75), (255, 255, 255), -1)
+        success, encoded_image = cv2.imencode(".png", image)
+        assert success
+
+        raw = client.extract_polygons(
+            image.tobytes(),
+            "test-entity",
+            "1",
+            image_format="raw_bgr",
+            width=100,
+            height=100,
+        )
+        encoded = client.extract_polygons(encoded_image.tobytes(), "test-entity", "1")
+
+        assert raw.total_count == encoded.total_count == 1
+        assert raw.polygons[0].area == encoded.polygons[0].area
+
+    def test_extract_polygons_raw_bgr_size_mismatch(self, sample_image):
+        """Test raw pixels with the wrong dimensions are rejected"""
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+
+        with pytest.raises(ValueError):
+            client.extract_polygons(
+                sample_image.tobytes(),
+                "test-entity",
+                "1",
+                image_format="raw_bgr",
+                width=50,
+                height=100,
+            )
+
     def test_batch_extract_empty_list(self):
         """Test batch_extract with empty floor plans list"""
         client = PlotExtractionClient()
@@ -219,6 +703,177 @@ class TestPlotExtractionClient:
         assert response.failed == 0
         assert len(response.extractions) == 0
 
+    def test_extract_polygons_from_file_missing(self, tmp_path):
+        """Test a missing file raises ValueError"""
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+
+        with pytest.raises(ValueError):
+            client.extract_polygons_from_file(
+                str(tmp_path / "missing.png"), "test-entity", "1"
+            )
+
+    def test_extract_polygons_from_file_png(self, tmp_path, sample_image_bytes):
+        """Test extracting from a PNG file on disk"""
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+        image_path = tmp_path / "floor.png"
+        image_path.write_bytes(sample_image_bytes)
+
+        response = client.extract_polygons_from_file(
+            str(image_path), "test-entity", "1"
+        )
+
+        assert response.stats.image_width == 100
+        assert response.stats.image_height == 100
+
+    def test_extract_polygons_from_file_cached(self, tmp_path, sample_image_bytes):
+        """Test repeat reads hit the cache until the file changes"""
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+        image_path = tmp_path / "floor.png"
+        image_path.write_bytes(sample_image_bytes)
+        plot_client._load_image_file.cache_clear()
+
+        client.extract_polygons_from_file(str(image_path), "test-entity", "1")
+        client.extract_polygons_from_file(str(image_path), "test-entity", "1")
+        assert plot_client._load_image_file.cache_info().hits == 1
+
+        # A rewritten file is a new cache entry, not a stale hit
+        success, encoded = cv2.imencode(".png", np.zeros((50, 80, 3), np.uint8))
+        assert success
+        image_path.write_bytes(encoded.tobytes())
+        response = client.extract_polygons_from_file(
+            str(image_path), "test-entity", "1"
+        )
+
+        assert response.stats.image_width == 80
+        assert plot_client._load_image_file.cache_info().misses == 2
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_batch_extract_keeps_order(self, tmp_path, sample_image_bytes, max_workers):
+        """Test batch results follow input order and count failures"""
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+        for name in ("1.png", "3.png"):
+            (tmp_path / name).write_bytes(sample_image_bytes)
+
+        floor_plans = [
+            ("1", str(tmp_path / "1.png")),
+            ("2", str(tmp_path / "missing.png")),
+            ("3", str(tmp_path / "3.png")),
+        ]
+        response = client.batch_extract(
+            floor_plans, "test-entity", max_workers=max_workers
+        )
+
+        assert [e.floor_id for e in response.extractions] == ["1", "2", "3"]
+        assert response.successful == 2
+        assert response.failed == 1
+        assert response.extractions[1].error
+
+    @pytest.mark.slow
+    def test_batch_extract_processes_match_threads(
+        self, monkeypatch, tmp_path, generated_task_pb2
+    ):
+        """Test worker processes return the same floors as the thread path"""
+        # Workers import the generated protos, not this module's mocks, so the
+        # parent parses their bytes with the generated FloorExtraction too
+        generated = generated_task_pb2
+
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+        image = np.zeros((200, 200, 3), dtype=np.uint8)
+        cv2.rectangle(image, (40, 60), (160, 140), (255, 255, 255), -1)
+        cv2.imwrite(str(tmp_path / "floor.png"), image)
+        floor_plans = [
+            ("1", str(tmp_path / "floor.png")),
+            ("2", str(tmp_path / "missing.png")),
+        ]
+
+        threaded = client.batch_extract(floor_plans, "test-entity")
+        monkeypatch.setattr(
+            PlotExtractionClient, "_FloorExtraction", generated.FloorExtraction
+        )
+        try:
+            processed = client.batch_extract(
+                floor_plans, "test-entity", use_processes=True
+            )
+        finally:
+            plot_client.shutdown_process_pool()
+
+        assert (processed.successful, processed.failed) == (1, 1)
+        assert len(processed.extractions[0].polygons) == 1
+        for expected, actual in zip(threaded.extractions, processed.extractions):
+            assert actual.floor_id == expected.floor_id
+            assert bool(actual.error) == bool(expected.error)
+            assert len(actual.polygons) == len(expected.polygons)
+            for want, got in zip(expected.polygons, actual.polygons):
+                assert got.area == pytest.approx(want.area)
+                assert (got.centroid.x, got.centroid.y) == pytest.approx(
+                    (want.centroid.x, want.centroid.y)
+                )
+                assert [(v.x, v.y) for v in got.vertices] == [
+                    (v.x, v.y) for v in want.vertices
+                ]
+
+    def test_batch_extract_resolves_config_once(self, tmp_path, sample_image_bytes):
+        """Test the batch path resolves the config once, not per floor"""
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+        client._get_config_with_defaults = MagicMock(
+            wraps=client._get_config_with_defaults
+        )
+        (tmp_path / "floor.png").write_bytes(sample_image_bytes)
+
+        response = client.batch_extract(
+            [(str(i), str(tmp_path / "floor.png")) for i in range(3)],
+            "test-entity",
+            max_workers=1,
+        )
+
+        assert response.successful == 3
+        assert client._get_config_with_defaults.call_count == 1
+
+    def test_batch_extract_gpu_decode(
+        self, monkeypatch, tmp_path, sample_image, sample_image_bytes
+    ):
+        """Test GPU-decoded floors skip the CPU read and failures fall back"""
+        rgb = cv2.cvtColor(sample_image, cv2.COLOR_BGR2RGB)
+        decoder = MagicMock()
+        decoder.decode.side_effect = lambda datas: [
+            MagicMock(cpu=lambda: rgb) if data == sample_image_bytes else None
+            for data in datas
+        ]
+        monkeypatch.setattr(plot_client, "_nvimgcodec_decoder", decoder)
+        load = MagicMock(wraps=plot_client._load_image_file)
+        monkeypatch.setattr(plot_client, "_load_image_file", load)
+
+        client = PlotExtractionClient()
+        client.stub = MagicMock()
+        (tmp_path / "1.png").write_bytes(sample_image_bytes)
+        (tmp_path / "2.png").write_bytes(b"not an image")
+
+        response = client.batch_extract(
+            [
+                ("1", str(tmp_path / "1.png")),
+                ("2", str(tmp_path / "2.png")),
+                ("3", str(tmp_path / "missing.png")),
+            ],
+            "test-entity",
+            max_workers=1,
+        )
+
+        # Unreadable files are not sent to the decoder
+        assert len(decoder.decode.call_args.args[0]) == 2
+        assert response.extractions[0].stats.image_width == 100
+        assert response.successful == 1
+        assert response.failed == 2
+        # Only the floors the GPU could not decode are read on the CPU path
+        assert [call.args[0] for call in load.call_args_list] == [
+            str(tmp_path / "2.png")
+        ]
+
     @pytest.mark.skipif(
         not Path("test_data/sample_floor_plan.png").exists(),
         reason="Test image not available",
@@ -239,6 +894,242 @@ class TestPlotExtractionClient:
         assert response.stats is not None
 
 
+class TestAsyncPlotExtractionClient:
+    """Test AsyncPlotExtractionClient functionality"""
+
+    @pytest.mark.asyncio
+    async def test_requires_connect(self):
+        """Test calls fail before connect()"""
+        client = AsyncPlotExtractionClient()
+
+        with pytest.raises(RuntimeError):
+            await client.batch_extract([], "test-entity")
+
+    @pytest.mark.asyncio
+    async def test_batch_extract(self, tmp_path, sample_image_bytes):
+        """Test concurrent batch extraction keeps order and counts failures"""
+        (tmp_path / "1.png").write_bytes(sample_image_bytes)
+
+        async with AsyncPlotExtractionClient("localhost:50099") as client:
+            response = await client.batch_extract(
+                [("1", str(tmp_path / "1.png")), ("2", str(tmp_path / "missing.png"))],
+                "test-entity",
+            )
+
+        assert [e.floor_id for e in response.extractions] == ["1", "2"]
+        assert response.successful == 1
+        assert response.failed == 1
+        # Extraction is local; no channel is opened
+        assert all(key[0] != "localhost:50099" for key in plot_client._CHANNEL_CACHE)
+
+    @pytest.mark.asyncio
+    async def test_stream_extract(self, tmp_path, sample_image_bytes):
+        """Test streamed extraction yields one result per floor"""
+        (tmp_path / "1.png").write_bytes(sample_image_bytes)
+
+        async with AsyncPlotExtractionClient("localhost:50099") as client:
+            extractions = [
+                extraction
+                async for extraction in client.stream_extract(
+                    [
+                        ("1", str(tmp_path / "1.png")),
+                        ("2", str(tmp_path / "missing.png")),
+                    ],
+                    "test-entity",
+                )
+            ]
+
+        by_floor = {e.floor_id: e for e in extractions}
+        assert sorted(by_floor) == ["1", "2"]
+        assert not by_floor["1"].error
+        assert by_floor["2"].error
+
+    @pytest.mark.asyncio
+    async def test_extraction_runs_on_compute_pool(self, sample_image_bytes):
+        """Test extraction uses the client's own pool, not the default executor"""
+        async with AsyncPlotExtractionClient("localhost:50099") as client:
+            perform = client._local._perform_local_extraction
+            threads = []
+
+            def record(*args):
+                threads.append(threading.current_thread().name)
+                return perform(*args)
+
+            client._local._perform_local_extraction = record
+            await client.extract_polygons(sample_image_bytes, "test-entity", "1")
+
+        assert threads[0].startswith("plot-extract")
+        assert client._compute is None
+
+    @pytest.mark.asyncio
+    async def test_extract_polygons(self, sample_image_bytes):
+        """Test single-image extraction runs off the event loop"""
+        async with AsyncPlotExtractionClient("localhost:50099") as client:
+            response = await client.extract_polygons(
+                sample_image_bytes, "test-entity", "1"
+            )
+
+        assert response.stats.image_width == 100
+
+
+class TestContourAreasCentroids:
+    """Test the vectorized contour area/centroid computation"""
+
+    def test_matches_opencv(self):
+        """Test results match cv2.contourArea and cv2.moments per contour"""
+        image = np.zeros((200, 200), dtype=np.uint8)
+        cv2.rectangle(image, (10, 10), (60, 40), 255, -1)
+        cv2.circle(image, (140, 140), 30, 255, -1)
+        cv2.fillPoly(image, [np.array([[20, 120], [80, 190], [10, 180]])], 255)
+        cv2.line(image, (150, 10), (190, 10), 255, 1)  # Degenerate sliver
+        contours, _ = cv2.findContours(
+            image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        )
+
+        areas, xs, ys = plot_client._contour_areas_centroids(contours)
+
+        for contour, area, x, y in zip(contours, areas, xs, ys):
+            moments = cv2.moments(contour)
+            assert area == pytest.approx(cv2.contourArea(contour))
+            if moments["m00"]:
+                assert x == pytest.approx(moments["m10"] / moments["m00"])
+                assert y == pytest.approx(moments["m01"] / moments["m00"])
+            else:
+                assert (x, y) == (0.0, 0.0)
+
+    def test_no_contours(self):
+        """Test an empty contour list gives empty arrays"""
+        areas, xs, ys = plot_client._contour_areas_centroids(())
+
+        assert len(areas) == len(xs) == len(ys) == 0
+
+
+class TestStructElem:
+    """Test the cached morphology kernel"""
+
+    def test_cached_rect_kernel(self):
+        """Test kernels are square, all ones, shared and read-only"""
+        kernel = plot_client._struct_elem(5)
+
+        assert kernel is plot_client._struct_elem(5)
+        assert np.array_equal(kernel, np.ones((5, 5), np.uint8))
+        assert not kernel.flags.writeable
+
+
+class TestPeekImageSize:
+    """Test header-only image size detection"""
+
+    def test_png(self):
+        """Test PNG size comes from the IHDR chunk"""
+        image = np.zeros((120, 200, 3), dtype=np.uint8)
+        success, encoded = cv2.imencode(".png", image)
+        assert success
+
+        assert plot_client._peek_image_size(encoded.tobytes()) == (200, 120)
+
+    def test_jpeg(self):
+        """Test JPEG size comes from the SOF segment"""
+        image = np.zeros((120, 200, 3), dtype=np.uint8)
+        success, encoded = cv2.imencode(".jpg", image)
+        assert success
+
+        assert plot_client._peek_image_size(encoded.tobytes()) == (200, 120)
+
+    def test_unrecognized(self):
+        """Test unknown or truncated data returns None"""
+        assert plot_client._peek_image_size(b"not an image") is None
+        assert plot_client._peek_image_size(b"\xff\xd8\xff") is None
+
+
+class TestDecodeImage:
+    """Test format-dispatched image decoding"""
+
+    @pytest.mark.parametrize("ext", [".png", ".jpg", ".bmp"])
+    def test_matches_imdecode_shape(self, sample_image, ext):
+        """Test every format decodes to a 3-channel BGR image"""
+        success, encoded = cv2.imencode(ext, sample_image)
+        assert success
+
+        image = plot_client._decode_image(encoded.tobytes())
+
+        assert image.shape == sample_image.shape
+        assert image.dtype == np.uint8
+        # Red rectangle stays red in BGR
+        assert image[50, 50, 2] > 200
+        assert image[50, 50, 0] < 50
+
+    def test_grayscale_png(self):
+        """Test grayscale PNGs are expanded to BGR like cv2.imdecode"""
+        gray = np.full((20, 30), 200, dtype=np.uint8)
+        success, encoded = cv2.imencode(".png", gray)
+        assert success
+
+        image = plot_client._decode_image(encoded.tobytes())
+
+        assert image.shape == (20, 30, 3)
+
+    def test_invalid_data(self):
+        """Test undecodable data returns None"""
+        assert plot_client._decode_image(b"not an image") is None
+
+    @staticmethod
+    def _rotated_jpeg(orientation, endian="<"):
+        """Encode a 40x80 JPEG tagged with an EXIF orientation."""
+        image = np.zeros((40, 80, 3), dtype=np.uint8)
+        cv2.rectangle(image, (0, 0), (19, 19), (0, 0, 255), -1)
+        success, encoded = cv2.imencode(".jpg", image)
+        assert success
+
+        byte_order = b"II" if endian == "<" else b"MM"
+        # TIFF header, then one IFD holding orientation as a SHORT
+        tiff = (
+            byte_order
+            + struct.pack(endian + "HI", 42, 8)
+            + struct.pack(endian + "H", 1)
+            + struct.pack(endian + "HHIHH", 0x0112, 3, 1, orientation, 0)
+            + struct.pack(endian + "I", 0)
+        )
+        payload = b"Exif\x00\x00" + tiff
+        app1 = b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+        data = encoded.tobytes()
+        return data[:2] + app1 + data[2:]
+
+    @pytest.mark.parametrize("endian", ["<", ">"])
+    def test_jpeg_orientation(self, sample_image, endian):
+        """Test the EXIF orientation is read from either byte order"""
+        assert plot_client._jpeg_orientation(self._rotated_jpeg(6, endian)) == 6
+
+        success, encoded = cv2.imencode(".jpg", sample_image)
+        assert success
+        assert plot_client._jpeg_orientation(encoded.tobytes()) == 1
+
+    def test_rotated_jpeg_matches_imdecode(self, monkeypatch):
+        """Test EXIF-rotated JPEGs skip TurboJPEG, which ignores orientation"""
+        turbojpeg = MagicMock()
+        turbojpeg.decode.side_effect = lambda data, scaling_factor: cv2.imdecode(
+            np.frombuffer(data, np.uint8),
+            cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION,
+        )
+        monkeypatch.setattr(plot_client, "_turbojpeg", turbojpeg)
+        data = self._rotated_jpeg(6)
+
+        image = plot_client._decode_image(data)
+
+        turbojpeg.decode.assert_not_called()
+        expected = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        np.testing.assert_array_equal(image, expected)
+        assert image.shape == (80, 40, 3)
+
+    def test_upright_jpeg_uses_turbojpeg(self, monkeypatch):
+        """Test JPEGs without a rotation still take the TurboJPEG path"""
+        turbojpeg = MagicMock()
+        monkeypatch.setattr(plot_client, "_turbojpeg", turbojpeg)
+
+        image = plot_client._decode_image(self._rotated_jpeg(1))
+
+        assert image is turbojpeg.decode.return_value
+
+
 class TestPlotExtractionConfig:
     """Test PlotExtractionConfig mock class"""
 
@@ -283,28 +1174,30 @@ class TestImageProcessing:
 
     def test_create_simple_test_image(self):
         """Test creating a test image for polygon extraction"""
-        # Create image with simple shapes
-        image = np.zeros((400, 400, 3), dtype=np.uint8)
+        # Create a single-channel image with simple shapes; extraction only
+        # looks at intensity
+        image = np.zeros((400, 400), dtype=np.uint8)
 
         # Draw a rectangle
-        cv2.rectangle(image, (50, 50), (150, 150), (255, 255, 255), -1)
+        cv2.rectangle(image, (50, 50), (150, 150), 255, -1)
 
         # Draw a circle
-        cv2.circle(image, (300, 300), 40, (255, 255, 255), -1)
+        cv2.circle(image, (300, 300), 40, 255, -1)
 
         # Verify image properties
-        assert image.shape == (400, 400, 3)
+        assert image.shape == (400, 400)
         assert image.dtype == np.uint8
 
         # Verify shapes are drawn (non-zero pixels exist)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        non_zero = np.count_nonzero(gray)
+        non_zero = np.count_nonzero(image)
         assert non_zero > 0
 
     def test_image_encoding_decoding(self):
         """Test image encoding and decoding"""
         # Create test image
-        original = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        original = np.random.default_rng(0).integers(
+            0, 256, (100, 100, 3), dtype=np.uint8
+        )
 
         # Encode
         success, encoded = cv2.imencode(".png", original)
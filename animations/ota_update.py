@@ -9,6 +9,8 @@ from manim import (
     FadeOut,
     Create,
     Transform,
+    LaggedStart,
+    ValueTracker,
     UP,
     DOWN,
     LEFT,
@@ -46,13 +48,21 @@ class OTAUpdatePipeline(Scene):
 
         self.wait(0.5)
 
+    def section_header(self, text, color):
+        """Section title placed under the scene title"""
+        return Tex(text, font_size=20, color=color).to_edge(UP).shift(DOWN * 0.5)
+
+    def running_label_for(self, text, partition):
+        """Status label beside a partition box"""
+        return (
+            Tex(text, font_size=12, color=GREEN)
+            .next_to(partition, RIGHT, buff=0.2)
+            .shift(UP * 0.2)
+        )
+
     def show_partition_layout(self):
         """Show ESP32-C3 flash partition structure"""
-        section_label = (
-            Tex("Flash Partition Layout", font_size=20, color=BLUE)
-            .to_edge(UP)
-            .shift(DOWN * 0.5)
-        )
+        section_label = self.section_header("Flash Partition Layout", BLUE)
         self.play(Write(section_label), run_time=0.3)
 
         # Flash partitions
@@ -88,16 +98,20 @@ class OTAUpdatePipeline(Scene):
         self.wait(0.5)
 
         # Highlight dual banks
-        ota0_highlight = partition_objects[2][0].copy().set_stroke(YELLOW, width=4)
-        ota1_highlight = partition_objects[3][0].copy().set_stroke(YELLOW, width=4)
+        # Restroke the bank boxes themselves rather than overlaying copies
+        ota0_box, ota1_box = partition_objects[2][0], partition_objects[3][0]
+        bank_strokes = [
+            (box, box.get_stroke_color(), box.get_stroke_width())
+            for box in (ota0_box, ota1_box)
+        ]
 
         dual_bank_note = Tex(
             "Dual-Bank: OTA\\_0 $\\leftrightarrow$ OTA\\_1", font_size=16, color=YELLOW
         ).next_to(partition_objects[3][0], RIGHT, buff=0.3)
 
         self.play(
-            Create(ota0_highlight),
-            Create(ota1_highlight),
+            ota0_box.animate.set_stroke(YELLOW, width=4),
+            ota1_box.animate.set_stroke(YELLOW, width=4),
             Write(dual_bank_note),
             run_time=0.7,
         )
@@ -107,8 +121,7 @@ class OTAUpdatePipeline(Scene):
         # Store for next scene
         self.section_label = section_label
         self.partition_objects = partition_objects
-        self.ota0_highlight = ota0_highlight
-        self.ota1_highlight = ota1_highlight
+        self.bank_strokes = bank_strokes
         self.dual_bank_note = dual_bank_note
 
     def show_download_write(self):
@@ -116,21 +129,19 @@ class OTAUpdatePipeline(Scene):
         self.play(
             Transform(
                 self.section_label,
-                Tex("Firmware Download \\& Flash Write", font_size=20, color=GREEN)
-                .to_edge(UP)
-                .shift(DOWN * 0.5),
+                self.section_header("Firmware Download \\& Flash Write", GREEN),
+            ),
+            *(
+                box.animate.set_stroke(color, width=width)
+                for box, color, width in self.bank_strokes
             ),
-            FadeOut(self.ota0_highlight),
-            FadeOut(self.ota1_highlight),
             FadeOut(self.dual_bank_note),
             run_time=0.4,
         )
 
         # Show current firmware running from OTA_0
-        running_label = (
-            Tex("Running from OTA\\_0", font_size=12, color=GREEN)
-            .next_to(self.partition_objects[2][0], RIGHT, buff=0.2)
-            .shift(UP * 0.2)
+        running_label = self.running_label_for(
+            "Running from OTA\\_0", self.partition_objects[2][0]
         )
         self.play(Write(running_label), run_time=0.4)
 
@@ -169,10 +180,12 @@ class OTAUpdatePipeline(Scene):
             width=0.1, height=1.4, color=GREEN, fill_opacity=0.6
         ).align_to(self.partition_objects[3][0], LEFT)
 
-        for i in range(5):
-            progress_bar.generate_target()
-            progress_bar.target.set_width((i + 1) * 0.8)
-            self.play(progress_bar.animate.set_width((i + 1) * 0.8), run_time=0.3)
+        # A single tween drives the bar instead of one play call per step
+        progress = ValueTracker(progress_bar.width)
+        progress_bar.add_updater(lambda bar: bar.set_width(progress.get_value()))
+        self.add(progress_bar)
+        self.play(progress.animate.set_value(4.0), run_time=1.5)
+        progress_bar.clear_updaters()
 
         self.wait(0.5)
 
@@ -189,9 +202,7 @@ class OTAUpdatePipeline(Scene):
         self.play(
             Transform(
                 self.section_label,
-                Tex("Verify \\& Activate", font_size=20, color=PURPLE)
-                .to_edge(UP)
-                .shift(DOWN * 0.5),
+                self.section_header("Verify \\& Activate", PURPLE),
             ),
             FadeOut(self.download_box),
             FadeOut(self.download_text),
@@ -257,10 +268,8 @@ class OTAUpdatePipeline(Scene):
         self.wait(0.3)
 
         # After reboot, running from OTA_1
-        new_running_label = (
-            Tex("Running from OTA\\_1", font_size=12, color=GREEN)
-            .next_to(self.partition_objects[3][0], RIGHT, buff=0.2)
-            .shift(UP * 0.2)
+        new_running_label = self.running_label_for(
+            "Running from OTA\\_1", self.partition_objects[3][0]
         )
 
         self.play(
@@ -282,9 +291,7 @@ class OTAUpdatePipeline(Scene):
         self.play(
             Transform(
                 self.section_label,
-                Tex("Rollback Safety", font_size=20, color=RED)
-                .to_edge(UP)
-                .shift(DOWN * 0.5),
+                self.section_header("Rollback Safety", RED),
             ),
             run_time=0.3,
         )
@@ -306,8 +313,11 @@ class OTAUpdatePipeline(Scene):
             .shift(LEFT * 3.5 + DOWN * 0.5)
         )
 
-        for attempt in boot_attempts:
-            self.play(Write(attempt), run_time=0.3)
+        # One play call writes the attempts in turn
+        self.play(
+            LaggedStart(*(Write(attempt) for attempt in boot_attempts), lag_ratio=1),
+            run_time=0.3 * len(boot_attempts),
+        )
 
         self.wait(0.3)
 
@@ -342,11 +352,14 @@ class OTAUpdatePipeline(Scene):
         )
 
         # Final highlight on OTA_0
-        final_highlight = self.partition_objects[2][0].copy().set_stroke(GREEN, width=4)
         final_label = Tex("Safe \\& Running", font_size=12, color=GREEN).next_to(
             self.partition_objects[2][0], RIGHT, buff=0.2
         )
 
-        self.play(Create(final_highlight), Write(final_label), run_time=0.5)
+        self.play(
+            self.partition_objects[2][0].animate.set_stroke(GREEN, width=4),
+            Write(final_label),
+            run_time=0.5,
+        )
 
         self.wait(0.5)
@@ -9,6 +9,7 @@ from manim import (
     FadeIn,
     FadeOut,
     Create,
+    LaggedStart,
     DashedLine,
     VMobject,
     Polygon,
@@ -140,13 +141,14 @@ class PathfindingVisualization(Scene):
         x_coords = [-2, -0.5, 1, 2.5]
         y_coords = [-1, 0.5, 1.5, 2]
 
-        grid_lines = VGroup()
-        for x in x_coords:
-            line = DashedLine([x, -1.2, 0], [x, 2.2, 0], color=GRAY, stroke_width=1)
-            grid_lines.add(line)
-        for y in y_coords:
-            line = DashedLine([-2.2, y, 0], [2.7, y, 0], color=GRAY, stroke_width=1)
-            grid_lines.add(line)
+        # Every vertical and every horizontal line has the same length, so
+        # the dashes are laid out once per direction and copied into place
+        v_line = DashedLine([0, -1.2, 0], [0, 2.2, 0], color=GRAY, stroke_width=1)
+        h_line = DashedLine([-2.2, 0, 0], [2.7, 0, 0], color=GRAY, stroke_width=1)
+        grid_lines = VGroup(
+            *(v_line.copy().shift(RIGHT * x) for x in x_coords),
+            *(h_line.copy().shift(UP * y) for y in y_coords),
+        )
 
         self.play(Create(grid_lines), run_time=0.7)
 
@@ -156,35 +158,35 @@ class PathfindingVisualization(Scene):
         ).next_to(step1, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(Write(step2), run_time=0.3)
 
-        # Create blocks
+        # Create blocks; block sizes and centers come from the grid
+        # coordinates in one pass, and every center is ray-cast at once
+        widths, heights = np.diff(x_coords), np.diff(y_coords)
+        center_xs = (np.array(x_coords[:-1]) + x_coords[1:]) / 2
+        center_ys = (np.array(y_coords[:-1]) + y_coords[1:]) / 2
+        inside = self.is_inside_polygon(
+            *np.meshgrid(center_xs, center_ys, indexing="ij"), polygon_points[:-1]
+        )
+
         blocks = []
-        for i in range(len(x_coords) - 1):
-            for j in range(len(y_coords) - 1):
-                x1, x2 = x_coords[i], x_coords[i + 1]
-                y1, y2 = y_coords[j], y_coords[j + 1]
-                center_x, center_y = (x1 + x2) / 2, (y1 + y2) / 2
-
-                # Check if inside (simplified ray-casting visualization)
-                is_inside = polygon.point_from_proportion(0)  # Placeholder
-                # Manually determine based on the polygon shape
-                is_inside = self.is_inside_polygon(
-                    center_x, center_y, polygon_points[:-1]
-                )
-
-                block_rect = Rectangle(
-                    width=x2 - x1,
-                    height=y2 - y1,
-                    stroke_width=1.5,
-                    stroke_color=GREEN if is_inside else RED,
-                    fill_opacity=0.3,
-                    fill_color=GREEN if is_inside else RED,
-                ).move_to([center_x, center_y, 0])
-
-                blocks.append((block_rect, is_inside, (i, j)))
-
-        # Animate block testing
-        for block, is_inside, _ in blocks:
-            self.play(FadeIn(block), run_time=0.05)
+        for i, j in np.ndindex(inside.shape):
+            is_inside = bool(inside[i, j])
+
+            block_rect = Rectangle(
+                width=widths[i],
+                height=heights[j],
+                stroke_width=1.5,
+                stroke_color=GREEN if is_inside else RED,
+                fill_opacity=0.3,
+                fill_color=GREEN if is_inside else RED,
+            ).move_to([center_xs[i], center_ys[j], 0])
+
+            blocks.append((block_rect, is_inside, (i, j)))
+
+        # Animate block testing; one play call reveals the blocks in turn
+        self.play(
+            LaggedStart(*(FadeIn(block) for block, _, _ in blocks), lag_ratio=1),
+            run_time=0.05 * len(blocks),
+        )
 
         self.wait(0.3)
 
@@ -194,23 +196,22 @@ class PathfindingVisualization(Scene):
         ).next_to(step2, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(Write(step3), run_time=0.3)
 
-        # Show a simple path
-        start_point = np.array([-1.25, 0.25, 0])
-        end_point = np.array([1.75, 1.25, 0])
+        # Simple path through bounded blocks, as one (N, 3) array
+        path_points = np.array(
+            [
+                [-1.25, 0.25, 0],
+                [-1.25, -0.25, 0],
+                [0.25, -0.25, 0],
+                [1.75, -0.25, 0],
+                [1.75, 1.25, 0],
+                [1.75, 1.25, 0],
+            ]
+        )
+        start_point, end_point = path_points[0], path_points[-1]
 
         start_dot = Dot(start_point, color=YELLOW, radius=0.1)
         end_dot = Dot(end_point, color=YELLOW, radius=0.1)
 
-        # Simple path through bounded blocks
-        path_points = [
-            start_point,
-            np.array([-1.25, -0.25, 0]),
-            np.array([0.25, -0.25, 0]),
-            np.array([1.75, -0.25, 0]),
-            np.array([1.75, 1.25, 0]),
-            end_point,
-        ]
-
         path_line = VMobject(color=YELLOW, stroke_width=5)
         path_line.set_points_as_corners(path_points)
 
@@ -224,14 +225,20 @@ class PathfindingVisualization(Scene):
         self.wait(0.5)
 
     def is_inside_polygon(self, x, y, points):
-        """Ray-casting algorithm to check if point is inside polygon"""
-        inside = False
-        n = len(points)
-        j = n - 1
-        for i in range(n):
-            xi, yi, _ = points[i]
-            xj, yj, _ = points[j]
-            if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-                inside = not inside
-            j = i
-        return inside
+        """Ray-casting algorithm to check if points are inside polygon
+
+        x and y may be arrays of the same shape; every point is tested against
+        all edges at once and a boolean array of that shape is returned
+        """
+        pts = np.asarray(points, dtype=float)
+        xi, yi = pts[:, 0], pts[:, 1]
+        # Edge i runs from vertex i - 1 to vertex i
+        xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+        x = np.asarray(x, dtype=float)[..., None]
+        y = np.asarray(y, dtype=float)[..., None]
+        # Horizontal edges divide by zero but never pass the straddle test
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossings = ((yi > y) != (yj > y)) & (
+                x < (xj - xi) * (y - yi) / (yj - yi) + xi
+            )
+        return np.logical_xor.reduce(crossings, axis=-1)